@@ -169,9 +169,24 @@ DEFAULTS = dict(        # DEFAULTS, often imported "as D".  ####
     # May be empty or non existent (if there is no default set.)
     cofa_name='CofA',              #| These three files will appear
     metadata_name='Metadata.json', #| in the .d directory of each
-    journal_name='Journal.json',   #| entity at the time of its
+    journal_name='Journal.jsonl',  #| entity at the time of its
         # creation . The first one is copied from a template in the
         # home directory; the other two are created.
+        # The journal is kept in JSON Lines format: one JournalEntry
+        # (as a json object) per line.
+    legacy_journal_name='Journal.json',  # Journals created before
+        # the change to JSON Lines were kept in a file by this name;
+        # if found, it is converted (once) by src.debk.Journal.
+    checkpoint_name='Checkpoint.json',  # Ledger balances as of a
+        # given journal entry: saves replaying the whole journal.
+    columnar=False,  # If True, each account keeps its postings in
+        # arrays (see src.debk.PostingColumns) rather than in a list
+        # of LineItem instances: much smaller for large ledgers.
+    lazy_journal=False,  # If True, saved journal entries are only
+        # read from file when needed (see src.debk.Journal.)
+    import_processes=1,  # If more than 1, journal entries loaded
+        # from text are parsed by that many processes (see
+        # src.debk.iter_load_parallel.)  Worthwhile for large files.
     currency=DEFAULT_CURRENCY,
     verbosity=DEFAULT_VERBOSITY,
     # Plan to make verbosity a bit map:
@@ -11,11 +11,17 @@ This module provides:
         representing a date in the "%b %d, %Y" format
         and returns a datetime.date instance.
         Returns None if the string is malformed.
+    ordinal_from_entry(date_entry): as date_object_from_entry but
+        returns the date's ordinal (see datetime.date.toordinal:)
+        an int that makes for quick comparisons.
+check_date and date_object_from_entry remember (a bounded number
+of) results: the same dates tend to come up over and over again.
 """
 
 import re
 import time
 import datetime
+import functools
 
 try:
     import src.config as config
@@ -44,7 +50,22 @@ number_pattern = re.compile(number_re)
 SHORT_MONTHS = {'Feb', 'Apr', 'Jun', 'Sep', 'Nov'}
 MONTHS = (
     {'Jan', 'Mar', 'May', 'Jul', 'Aug', 'Oct', 'Dec'} | SHORT_MONTHS)
+MONTH_NAMES = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+               'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+MONTH_NUMBERS = {name: number
+                for number, name in enumerate(MONTH_NAMES, 1)}
 
+CACHE_SIZE = 1024  # Number of results each function remembers.
+
+# The shapes of the most common entries: dealt with without strptime.
+month_name_shape = re.compile(   # e.g. "Jul 3, 2015" or "July 3, 15"
+    r"([A-Za-z]{3})[A-Za-z]* ?(\d{1,2}),? (\d{4}|\d{2})")
+month_number_shape = re.compile(  # e.g. "07 03 2015" or "7/3/15"
+    r"(\d{1,2})[ /-](\d{1,2})[ /-](\d{4}|\d{2})")
+date_stamp_shape = re.compile(    # "%b %d, %Y" e.g. "Jul 03, 2015"
+    r"([A-Z][a-z]{2}) (\d{2}), (\d{4})")
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
 def check_date(date_entry):
     """
     Checks that something reasonable was provided as a date.
@@ -52,6 +73,46 @@ def check_date(date_entry):
     Month and Day can be without any separator between them.
     Returns standard Month, Day, Year (Mmm dd, yyy) formated
     string or None if uninterpretable.
+    Common shapes are dealt with by quick_check_date; parse_date
+    does the rest.
+    """
+    try:
+        return quick_check_date(date_entry)
+    except ValueError:  # Not a shape quick_check_date deals with.
+        return parse_date(date_entry)
+
+def quick_check_date(date_entry):
+    """
+    check_date for entries of the month_name_shape or
+    month_number_shape (and reasonable year.)  Gives the same
+    results as parse_date but without its regex searches and
+    without strptime.
+    Raises ValueError if date_entry is of neither shape.
+    """
+    shape = month_name_shape.fullmatch(date_entry)
+    if shape:
+        month = MONTH_NUMBERS.get(shape.group(1).capitalize())
+        if month is None:
+            raise ValueError(date_entry)
+    else:
+        shape = month_number_shape.fullmatch(date_entry)
+        if not shape:
+            raise ValueError(date_entry)
+        month = int(shape.group(1))
+    day = int(shape.group(2))
+    year = int(shape.group(3))
+    if year < 100: year += 2000
+    elif year < 1000: raise ValueError(date_entry)  # strptime's %Y
+                                    # expects 4 digits; leave it to it.
+    try:
+        datetime.date(year, month, day)
+    except ValueError:
+        return
+    return "{} {:02}, {}".format(MONTH_NAMES[month - 1], day, year)
+
+def parse_date(date_entry):
+    """
+    The general (and slow) version of check_date.
     """
 #   print("Checking '{}'...".format(date_entry))
     dt = None
@@ -104,12 +165,21 @@ def check_date(date_entry):
 #           .format(dt.strftime(month_name_entry_format)))
         return dt.strftime(month_name_entry_format)
 
+@functools.lru_cache(maxsize=CACHE_SIZE)
 def date_object_from_entry(date_string):
     """
     Takes a string representing a date in the "%b %d, %Y"
     format and returns a datetime.date instance.
     Returns None if the string is malformed.
     """
+    shape = date_stamp_shape.fullmatch(date_string)
+    if shape and shape.group(1) in MONTH_NUMBERS:
+        try:
+            return datetime.date(int(shape.group(3)),
+                                MONTH_NUMBERS[shape.group(1)],
+                                int(shape.group(2)))
+        except ValueError:
+            return
     try:
         dt = datetime.datetime.strptime(
             date_string, month_name_entry_format)
@@ -117,6 +187,25 @@ def date_object_from_entry(date_string):
         return
     return datetime.date(dt.year, dt.month, dt.day)
 
+def ordinal_from_entry(date_entry):
+    """
+    Returns the (proleptic Gregorian) ordinal of the date
+    represented by date_entry: a datetime.date instance or a
+    string in the "%b %d, %Y" format (or any format check_date
+    accepts.)  Returns None if date_entry is not interpretable.
+    """
+    if isinstance(date_entry, datetime.date):
+        return date_entry.toordinal()
+    if not isinstance(date_entry, str):
+        return
+    date_object = date_object_from_entry(date_entry)
+    if date_object is None:
+        date_entry = check_date(date_entry)
+        if date_entry is None:
+            return
+        date_object = date_object_from_entry(date_entry)
+    return date_object.toordinal()
+
 def string_from_date_object(date_object):
     """
     Takes a datetime.date object and returns a string
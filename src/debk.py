@@ -58,10 +58,15 @@ The first usage is only to run minor tests.
 #            LineEntry  / ditto for JournalEntry LineEntrys.
 
 import os
+import re
 import sys
 import csv
 import json
-import copy
+import bisect
+import collections
+import concurrent.futures
+import hashlib
+from array import array
 #import shutil
 import logging
 #import datetime
@@ -124,6 +129,22 @@ def convert2dict(an_object):
             for key in vars(an_object)
                 if key[:1] != '_'}
 
+def write_joined(pieces, f_object, separator='\n'):
+    """
+    Writes the strings provided by the iterable pieces to f_object
+    with separator between them: the same text as
+    f_object.write(separator.join(pieces)) but without ever holding
+    all of it.  Used with the iter_show... methods (generators) of
+    Journal and ChartOfAccounts.
+    """
+    first = True
+    for piece in pieces:
+        if first:
+            first = False
+        else:
+            f_object.write(separator)
+        f_object.write(piece)
+
 def show_args(args, name = 'Arguments'):
     """                     [../tests/test1.py: global_show_args]
     Returns a string displaying args, which can be any iteration
@@ -163,33 +184,39 @@ def divider(dollar_amount, split):
     Attempts to divide 'dollar_amount' into 'split' equal parts.
     Returns a 'split' long list of floats.  Expects 'dollar_amount'
     to be a float, 'split' to be an int.  Works to the nearest penney.
-    When equal amounts are not possible, if dollar_amount is positive,
-    the first numbers in the list will be greater than the last by
-    one; if negative, it's the ending numbers that are greater.
-    An assertionError is raised if the sum of the list is not equal
-    to 'dollar_amount'.  This occurs if split is negative.
-    Behaves sensibly with negative dollar_ammount in wich case left
-    over is added from end rather than beginning of resulting list.
+    A dollars in, dollars out wrapper around divide_cents (see its
+    docstring) which is what the posting code uses.
     """
     try:   # money as float or string => pennies/int
-        dollars = float(dollar_amount)  # Might come in as a string.
+        dividend = money.to_cents(dollar_amount)  # Might be a string.
     except ValueError:
         logging.critical("Bad 1st param: divider({}, {})"
             .format(dollar_amount, split))
         raise
-    dividend = round(dollars * 100)
+    return [cents / 100 for cents in divide_cents(dividend, split)]
+
+def divide_cents(cents, split):
+    """                                [../tests/test1.py: divider
+    Divides 'cents' (an int) into 'split' (an int) equal parts.
+    Returns a 'split' long list of ints.
+    When equal amounts are not possible, if cents is positive,
+    the first numbers in the list will be greater than the last by
+    one; if negative, it's the ending numbers that are greater.
+    An assertionError is raised if the sum of the list is not equal
+    to 'cents'.  This occurs if split is negative.
+    """
     if split <=0:
         logging.critical(
-        "Bad 2nd param (not a positive int): divider({}, {})"
-            .format(dollar_amount, split))
-    quotient, rem = divmod(dividend, split)
+        "Bad 2nd param (not a positive int): divide_cents({}, {})"
+            .format(cents, split))
+    quotient, rem = divmod(cents, split)
     ret = []  # Prepare to create a list with 'split' entries.
     for n in range(1, split + 1):
         if n > rem:  # Assign quotient (remainder 'used up.)
-          ret.append(quotient/100.0)
+            ret.append(quotient)
         else:  # Still need to 'use up' remainder.
-            ret.append((quotient + 1)/100.0)
-    assert (abs(dollars)-abs(sum(ret)))<config.EPSILON  # Sanity chk.
+            ret.append(quotient + 1)
+    assert sum(ret) == cents  # Sanity check.
     return ret
 
 # The following two functions would be better placed in in
@@ -235,6 +262,159 @@ def acnt_type_from_code(account_code):
     logging.critical(
         "Malformed account code: '%s'", account_code)
 
+NORMAL_TYPES = dict([(first, 'D') for first in config.DR_FIRSTS]
+                  + [(first, 'C') for first in config.CR_FIRSTS])
+    # The type_ ('D' or 'C') of a positive balance keyed by the
+    # first character of an account code.
+
+def atomic_write(file_name, text):
+    """
+    Replaces the content of file_name with text in such a way that
+    a crash leaves either the old or the new content, never a mix:
+    text goes to a temporary file which is fsync'ed and then renamed
+    over file_name.  (The rename is atomic on POSIX systems.)
+    """
+    tmp_name = file_name + '.tmp'
+    with open(tmp_name, 'w', newline='') as f_object:
+        f_object.write(text)
+        f_object.flush()
+        os.fsync(f_object.fileno())
+    os.replace(tmp_name, file_name)
+    try:  # Make the rename itself durable.
+        dir_fd = os.open(os.path.dirname(file_name) or '.', os.O_RDONLY)
+    except OSError:  # Not possible on some platforms.
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+def file_digest(file_name, size):
+    """
+    Returns the (hex) sha1 digest of the first size bytes of
+    file_name.
+    """
+    digest = hashlib.sha1()
+    with open(file_name, 'rb') as f_object:
+        while size > 0:
+            chunk = f_object.read(min(size, 1 << 20))
+            if not chunk:
+                break
+            digest.update(chunk)
+            size -= len(chunk)
+    return digest.hexdigest()
+
+ENTRY_NUMBER_PREFIX = re.compile(rb'\{"entry_number": (\d+)[,}]')
+
+ORDINAL_FIELD = re.compile(rb'"ordinal": (\d+|null)[,}]')
+
+def entry_number_from_line(line):
+    """
+    Returns the entry_number of the journal entry saved (as json)
+    in line (bytes) without decoding all of it: entries are saved
+    with entry_number first.  Lines that don't start that way (as
+    may be the case for converted legacy journals) are decoded.
+    """
+    match = ENTRY_NUMBER_PREFIX.match(line)
+    if match:
+        return int(match.group(1))
+    return int(json.loads(line.decode('utf-8'))['entry_number'])
+
+LINE_ENTRY_TOKEN = re.compile(r"""
+(?P<codes>{0}(?:,{0})*)(?=\s|$)     # account code(s)
+|
+(?P<drcr>[DC]r)(?=\s|$)
+|
+(?P<amount>(?P<minus>-?)(?P<dollars>\d*)[.](?P<cents>\d{{0,2}})
+    (?P<suffix>[DC]r)?)(?=\s|$)     # no currency symbol
+|
+(?P<other>\S+)
+""".format(config.DIGITS), re.VERBOSE)
+
+def scan_line_entry(line):
+    """
+    Single pass alternative to running money.get_currency_cents,
+    config.get_list_of_accounts and drcr.drcr over a line entry
+    line: returns what they would in a (cents, accounts, type_)
+    tuple.
+    Only lines in the usual form are dealt with: one each of
+    account code(s), 'Dr' or 'Cr', and (non zero) amount without
+    a currency symbol, with nothing else.  Otherwise None is
+    returned and it is up to the caller to use the three functions.
+    """
+    cents = accounts = type_ = None
+    for token in LINE_ENTRY_TOKEN.finditer(line):
+        kind = token.lastgroup
+        if kind == 'codes':
+            if accounts:
+                return
+            accounts = token.group('codes').split(',')
+        elif kind == 'amount':
+            dollars = token.group('dollars')
+            if cents is not None or (not accounts and
+                    len(dollars) == config.ACCOUNT_NUMBER_LENGTH):
+                return  # (The latter would be taken for a code.)
+            cents = (int(dollars or '0') * 100
+                    + int(token.group('cents').ljust(2, '0')))
+            if token.group('minus'):
+                cents = -cents
+            suffix = token.group('suffix')
+            if suffix:
+                if type_:
+                    return
+                type_ = suffix
+        elif kind == 'drcr':
+            if type_:
+                return
+            type_ = token.group('drcr')
+        else:
+            return
+    if accounts and type_ and cents:
+        return cents, accounts, type_
+
+def input_lines(text_or_filename):
+    """
+    Generates the lines (without their line endings) of a file,
+    if text_or_filename names one, or else of the text itself.
+    The same lines as text.split('\n') would give (including an
+    empty last line if the text ends with a line ending) but a
+    file is read a line at a time rather than all at once.
+    """
+    if not os.path.isfile(text_or_filename):
+        yield from text_or_filename.split('\n')
+        return
+    with open(text_or_filename, 'r') as f_object:
+        line = '\n'  # An empty file is one empty line.
+        for line in f_object:
+            yield line.rstrip('\n')
+        if line.endswith('\n'):
+            yield ''
+
+def ordinal_from_line(line):
+    """
+    As entry_number_from_line but returns the ordinal (None if
+    there is none) of the journal entry saved in line.
+    (Entries saved before ordinals were kept are decoded.)
+    """
+    match = ORDINAL_FIELD.search(line)
+    if match:
+        if match.group(1) == b'null':
+            return
+        return int(match.group(1))
+    return JournalEntry.from_dict(
+                        json.loads(line.decode('utf-8'))).ordinal
+
+CHECKPOINT_FORMAT = 2  # Incremented if what a checkpoint holds
+                       # changes: e.g. 2 => balances in cents.
+
+# Formats used (as bound methods) by the show methods of LineEntry
+# and JournalEntry; line entries are keyed by type_:
+LINE_ENTRY_FORMATS = dict(D= "      {}:{:>12}Dr".format,
+                          C= "      {}:{:>26}Cr".format)
+JOURNAL_ENTRY_HEADER = "  #{:0>3} on {:<12} by {}.".format
+
 #####  END OF HELPER FUNCTIONS  #####
 
 
@@ -247,16 +427,21 @@ class LineItem(object):
     instances of the Account class.
     Each instance has the following attributes:
         number: a journal entry number: discoverable from Journal
-        amount: monitary value   }|  Both discoverable from
+        cents: monitary value    }|  Both discoverable from
         type_:  specify Dr or Cr }|  a JournalEntry instance.
     Do NOT confuse this class with Journal LineEntry entries.
+    There is one instance per posting so __slots__ is used to keep
+    instances small.
     """
+
+    __slots__ = ('entry_number', 'type_', 'cents')
     
-    def __init__(self, entry_number, type_, amount):
+    def __init__(self, entry_number, type_, amount=None, cents=None):
         """
         entry_number: journal entry number.
         type_: 'D'(ebit or 'C'(redit. 
-        amount: float.
+        amount: dollars (float) or, instead,
+        cents: int (which is what is kept.)
         """
 #       print("\n Running LineItem({}, {}, {})"
 #                   .format(entry_number, type_,amount))
@@ -267,24 +452,87 @@ class LineItem(object):
                 "Calling LineItem.__init__ with bad type_: '{}'"
                 .format(type_))
         self.entry_number = int(entry_number)
-        self.amount = float(amount)
+        if cents is None:
+            cents = money.to_cents(amount)
+        self.cents = int(cents)
         self.type_ = type_[:1].upper()
 
+    @property
+    def amount(self):
+        """
+        The value in dollars (a float:) for display only.
+        """
+        return self.cents / 100
+
     def show(self):
         """
         Returns a _one_line_ string representation of a LineItem
         instance.
         Any required indention can be handled by the client code.
         """
-        if self.type_ == 'D': dr = '{:>12.2f}Dr'.format(self.amount)
+        amount = money.dollars(self.cents)
+        if self.type_ == 'D': dr = '{:>12}Dr'.format(amount)
         else: dr = '{:>14}'.format(' ')
-        if self.type_ == 'C': cr = '{:>12.2f}Cr'.format(self.amount)
+        if self.type_ == 'C': cr = '{:>12}Cr'.format(amount)
         else: cr = '{:>14}'.format(' ')
         return ("  je#{:0>3}{}{}"
                 .format(self.entry_number, dr, cr))
 
     __str__ = show
 
+    @staticmethod
+    def show_brought_forward(cents):
+        """
+        Returns a one line string, formatted to line up with the
+        output of show, representing a balance brought forward:
+        positive amounts being debits, negative ones credits.
+        """
+        if cents > 0:
+            return "  b/f   {:>12}Dr".format(money.dollars(cents))
+        return "  b/f   {:>14}{:>12}Cr".format(' ', money.dollars(-cents))
+
+class PostingColumns(object):
+    """
+    An alternative to a list of LineItem instances for keeping an
+    account's postings: two parallel arrays of 64 bit integers, one
+    of journal entry numbers and the other of signed cents (debits
+    positive, credits negative.)  Used by Account if the 'columnar'
+    default is set.
+    Supports the parts of the list interface Account uses (append,
+    len and iteration) with LineItem instances created only as
+    iteration reaches them.
+    """
+
+    __slots__ = ('entry_numbers', 'signed_cents')
+
+    def __init__(self):
+        self.entry_numbers = array('q')
+        self.signed_cents = array('q')
+
+    def append(self, line_item):
+        self.entry_numbers.append(line_item.entry_number)
+        if line_item.type_ == 'D':
+            self.signed_cents.append(line_item.cents)
+        else:
+            self.signed_cents.append(-line_item.cents)
+
+    def __len__(self):
+        return len(self.entry_numbers)
+
+    def __iter__(self):
+        for entry_number, cents in zip(self.entry_numbers,
+                                        self.signed_cents):
+            if cents < 0:
+                yield LineItem(entry_number, 'C', cents=-cents)
+            else:
+                yield LineItem(entry_number, 'D', cents=cents)
+
+    def net(self):
+        """
+        Returns the sum of debits less the sum of credits (cents.)
+        """
+        return sum(self.signed_cents)
+
 class Account(object):
     """              [../tests/test1.py: CreateAccount,
                         Account_empty, Account_loaded
@@ -294,7 +542,7 @@ class Account(object):
     Attributes include: 
     1. from csv file:   code, indent, full_name, name, notes,
                         hidden, place_holder, split, 
-    2. derived:   balance, line_items,
+    2. derived:   balance, line_items,  (money in int cents)
         s_balance, signed_balance,  
         (depending if place_holder, see below)
         type_: specifies if the balance is a D(ebit or C(redit,
@@ -309,18 +557,22 @@ class Account(object):
     return the corresponding (signed) value.
     """
 
-    def __init__(self, dict_from_csv):         # Account
+    def __init__(self, dict_from_csv, columnar=False):  # Account
         """                  [../tests/test1.py: CreateAccount]
         Accepts dict delivered by csv module as its parameter.
         code,indent,type,full_name,name,hidden,place_holder,split
+        If columnar is True, line_items is a PostingColumns instance
+        rather than a list.
         """
-        dict_from_csv['code'] = dict_from_csv['code'].strip()
+        dict_from_csv['code'] = sys.intern(dict_from_csv['code'].strip())
         self.code = dict_from_csv['code']
+        self.normal_type = NORMAL_TYPES.get(self.code[:1])  # The
+                    # type_ ('D' or 'C') of a positive balance.
 #       print("dict_from_csv => {}"  # debugging print
 #                   .format(dict_from_csv))
         self.category = config.account_category(self.code)
-        self.indent = INDENTATION_CONSTANT * int(
-                                    dict_from_csv['indent'])
+        self.level = int(dict_from_csv['indent'])
+        self.indent = INDENTATION_CONSTANT * self.level
         self.full_name = dict_from_csv['full_name']
         self.name = dict_from_csv['name']
 #       self.notes = dict_from_csv['notes']  # removed from csv
@@ -354,29 +606,42 @@ class Account(object):
                             # _set_place_holder_signed_balances method
                             # of the ChartOfAccounts class and
                             # applies only to place_holder accounts.
-        self.line_items = []
+        if columnar:
+            self.line_items = PostingColumns()
+        else:
+            self.line_items = []
+        self.net = 0  # Running total of line_items: Dr - Cr.
+        self.brought_forward = 0  # Dr (positive) or Cr (negative)
+                    # balance taken from a checkpoint rather than
+                    # from line_items: see ChartOfAccounts.checkpoint.
+        self.parent = None  # | Code of the enclosing place_holder
+        self.children = []  # | account and codes of the accounts
+                            # | it encloses: set up by
+                            # | ChartOfAccounts._build_account_tree.
+        self.fragments = {}  # What show_account has returned, keyed
+                            # by verbosity; discarded when dirty.
+        self.dirty = False  # Set when what is shown changes.
+        self.chart = None  # The ChartOfAccounts the account belongs
+                        # to (if any:) see _set_balance.
 
     @property
     def signed_balance(self):
         """                [../tests/test1.py: Account_signed_balance]
         Checks (based on its code) if an account's balance is positive
         or negative and returns the balance appropriately signed.
-        REFACTOR TO USE category INSTEAD OF code ATTRIBUTE.
         """
         #  If nothing in account, not to worry:
-        if (self.balance < config.EPSILON or 
-        #  Asset and Expense accounts are Debit accounts:
-        (self.code[:1] in config.DR_FIRSTS and self.type_ == 'D')
+        if (self.balance <= 0 or 
+        #  Asset and Expense accounts are Debit accounts,
         #  Liability, Equity and Income accounts are Credit accounts:
-        or (self.code[:1] in config.CR_FIRSTS and self.type_ == 'C')
-        ):
+        self.type_ == self.normal_type):
             logging.debug(
-                "Accnt %s%s has the appropriate Dr/Cr balance: %.2f",
+                "Accnt %s%s has the appropriate Dr/Cr balance: %s",
                     self.code, self.type_, self.balance)
             return self.balance  # As it should be.
         else:
             logging.debug(
-                "Accnt %s%s has a NEGATIVE Dr/Cr balance:      %.2f",
+                "Accnt %s%s has a NEGATIVE Dr/Cr balance:      %s",
                     self.code, self.type_, self.balance)
             return self.balance * -1
 
@@ -417,7 +682,22 @@ class Account(object):
         the src/menu.py menu.
         See src/config.py for details of what each verbosity level
         means.
+        What is returned is kept (in the fragments attribute) and
+        returned again until the account is marked dirty (by
+        posting to it or changing its balance or subtotal.)
         """
+        if self.dirty:
+            self.fragments = {}
+            self.dirty = False
+        try:
+            return self.fragments[verbosity]
+        except KeyError:
+            text = self._render_account(verbosity)
+            self.fragments[verbosity] = text
+            return text
+
+    def _render_account(self, verbosity):
+        """See show_account."""
         if not verbosity:    # Just show the account metadata.
             ret = []
             if self.place_holder:
@@ -437,27 +717,31 @@ class Account(object):
             if self.s_balance:
                 has_balance = True
             ret.append(
-                "{} {} (Title_Account) subtotal: {:.2f}".
+                "{} {} (Title_Account) subtotal: {}".
                 format(
                     self.full_name.upper(),
                     self.split_as_str,
-                    self.s_balance))
+                    money.dollars(self.s_balance)))
         else: 
             if self.balance:
                 has_balance = True
                 type_ = self.type_ + 'r'
             else:
                 type_ = ''
-            ret.append("{:<15} {} Total:{:>10.2f}{}"
+            ret.append("{:<15} {} Total:{:>10}{}"
                     .format(
                             self.name,
                             self.split_as_str,
-                            self.balance,
+                            money.dollars(self.balance),
                             type_))
         # Join the two parts to complete the first (header) line:
         ret = [' '.join(ret)]
 
         if verbosity > 1: # Add the line entries:
+            if self.brought_forward:
+                ret.append('{}{}'.format(self.indent,
+                    LineItem.show_brought_forward(
+                                    self.brought_forward)))
             for line_item in self.line_items:
                 ret.append('{}{}'.format(self.indent,
                                         line_item.show()))
@@ -484,18 +768,48 @@ class Account(object):
         """
         if self.place_holder == 'T':
             return  # Defaults have already been set.
-        totals = dict(D= 0, C= 0)
-        for line_item in self.line_items:
-            if line_item.amount:
-                totals[line_item.type_] += line_item.amount
-        if (totals['D'] - totals['C']) > config.EPSILON:
-            self.balance = totals['D'] - totals['C']
+        if isinstance(self.line_items, PostingColumns):
+            self.net = self.line_items.net()
+        else:
+            totals = dict(D= 0, C= 0)
+            for line_item in self.line_items:
+                totals[line_item.type_] += line_item.cents
+            self.net = totals['D'] - totals['C']
+        self._set_balance()
+
+    def post(self, line_item):
+        """
+        Adds line_item to line_items and brings the balance and
+        type_ attributes up to date without traversing line_items.
+        """
+        self.line_items.append(line_item)
+        self.dirty = True
+        if line_item.type_ == 'D':
+            self.net += line_item.cents
+        else:
+            self.net -= line_item.cents
+        self._set_balance()
+
+    def _set_balance(self):
+        """
+        Sets the balance and type_ attributes from the running
+        total of line_items (the net attribute) and any balance
+        brought forward.
+        A change of balance is also a new generation of the chart
+        of accounts (if any) the account belongs to.
+        """
+        self.dirty = True
+        if self.chart is not None:
+            self.chart.generation += 1
+        net = self.brought_forward + self.net
+        if net > 0:
+            self.balance = net
             self.type_ = 'D'
-        elif (totals['C'] - totals['D']) > config.EPSILON:
-            self.balance = totals['C'] - totals['D']
+        elif net < 0:
+            self.balance = -net
             self.type_ = 'C'
-        else:  
-            assert self.balance == 0.0
+        else:
+            self.balance = 0
             self.type_ = ''
 
 class ChartOfAccounts(object):
@@ -533,15 +847,56 @@ class ChartOfAccounts(object):
         self.verbosity = defaults['verbosity']
         self.home = os.path.join(D['home'], self.entity  + '.d')
         self.cofa_file = os.path.join(self.home, D['cofa_name'])
+        self.checkpoint_file = os.path.join(self.home,
+                    defaults.get('checkpoint_name', 'Checkpoint.json'))
         self.csv_dict = {}  # Keyed by account number ('code'.)
         self.code_set = set()
+        self.trial_balance = dict(D= 0, C= 0)  # Running totals of
+                            # all that has been posted or brought
+                            # forward.
+        self.journal = None  # The Journal whose entries are loaded:
+                            # needed only for as of date queries.
+        self.brought_forward = (None, 0)  # The journal and number of
+                            # the last entry of a checkpoint that was
+                            # loaded (see fill_in_brought_forward.)
+        self.read_chart()
+        self.accounts = {key:
+                Account(self.csv_dict[key],
+                        defaults.get('columnar', False))
+                for key in self.code_set}
+        for account in self.accounts.values():
+            account.chart = self
+        # The accounts attribute is not fully populated until if and
+        # when needed.  This is done using the load_journal_entries()
+        # method.
+        self._build_account_tree()
+        self.ordered_codes = sorted([key for key in self.code_set])
+#       logging.debug(self.ordered_codes)
+        # The codes again, in numeric order along with their values,
+        # so that a range of codes can be found by bisection:
+        by_number = sorted((int(code), code)
+                            for code in self.ordered_codes)
+        self._code_numbers = [number for number, code in by_number]
+        self._codes_by_number = [code for number, code in by_number]
+        self.generation = 0  # Incremented whenever a balance changes
+                            # (see Account._set_balance.)
+        self._range_sums = {}  # sum_accounts results keyed by range,
+                            # valid while generation is unchanged.
+        self._last_report = None  # (key, generation, text) of the
+                            # last report shown: see _kept_report.
+
+    def read_chart(self):
+        """
+        Reads the chart of accounts (CSV) file populating the
+        csv_dict and code_set attributes.
+        """
         try:
             with open(self.cofa_file, 'r') as cofa_file_object:
                 reader = csv.DictReader(cofa_file_object)
                 for row in reader:
 #                   logging.debug(
 #                       show_args(row, 'CofA input line values'))
-                    row['code'] = row['code'].strip()
+                    row['code'] = sys.intern(row['code'].strip())
                     if row['code'] in self.code_set:
 #                       print(   # debugging print
 #               "Duplicate account code:{}; Fix before rerunning.."
@@ -558,13 +913,23 @@ class ChartOfAccounts(object):
                 "Perhaps entity", self.entity,
                 "has not yet been created.")
             sys.exit(1)
-        self.ordered_codes = sorted([key for key in self.code_set])
-#       logging.debug(self.ordered_codes)
-        self.accounts = {key:
-                Account(self.csv_dict[key]) for key in self.code_set}
-        # The accounts attribute is not fully populated until if and
-        # when needed.  This is done using the load_journal_entries()
-        # method.
+
+    def _build_account_tree(self):
+        """
+        Sets the parent and children attributes of each account.
+        An account's parent is the closest preceding (in code order)
+        place_holder account with a lower indent.
+        """
+        headers = []  # Stack of enclosing place_holder accounts.
+        for code in sorted(self.code_set):
+            acnt = self.accounts[code]
+            while headers and headers[-1].level >= acnt.level:
+                headers.pop()
+            if headers:
+                acnt.parent = headers[-1].code
+                headers[-1].children.append(code)
+            if acnt.place_holder:
+                headers.append(acnt)
 
     def _dict(self):
         """
@@ -593,88 +958,215 @@ class ChartOfAccounts(object):
 
     def _set_place_holder_signed_balances(self):
         """
-        Iterates through the accounts setting the signed_balance
-        attribute for each of the place_holder accounts.
-        A private method used only by load_journal_entries method.
+        Recomputes, from scratch, the s_balance (subtotal) attribute
+        of each of the place_holder accounts: a single bottom up
+        pass over the account tree (children always follow their
+        parent in code order.)
+        load_journal_entries keeps subtotals up to date incrementally
+        (see _adjust_subtotals) so this is only needed if balances
+        are changed by other means.
         """
-#       print("Running _set_place_holder_signed_balances...")
-        I = len(self.ordered_codes)  # Don't index here or beyond.
-        for code in self.ordered_codes:
+        for code in reversed(self.ordered_codes):
             acnt = self.accounts[code]
             if acnt.place_holder:
-#               print("..Considering account code: {}"
-#                       .format(code))
-                indent = acnt.indent
+                acnt.dirty = True
                 acnt.s_balance = 0
-                i = self.ordered_codes.index(code) + 1
-                while True:
-                    if (i >= I
-                    or (self.accounts[self.ordered_codes[i]].indent
-                                                    <= indent)):
-                        break  # out of while loop.
-                    sub_acnt = self.accounts[self.ordered_codes[i]]
-#                   print("....Checking #{}"
-#                           .format(self.ordered_codes[i]))
-                    if not sub_acnt.place_holder:
-#                       print("....it is a place holder so adding {}"
-#                               .format(sub_acnt.signed_balance))
-                        acnt.s_balance += sub_acnt.signed_balance
-                    i += 1
+                for child_code in acnt.children:
+                    child = self.accounts[child_code]
+                    if child.place_holder:
+                        acnt.s_balance += child.s_balance
+                    else:
+                        acnt.s_balance += child.signed_balance
+
+    def _adjust_subtotals(self, code, delta):
+        """
+        Adds delta (a change in the signed_balance of the account
+        specified by code) to the s_balance of each of its enclosing
+        place_holder accounts.
+        """
+        parent = self.accounts[code].parent
+        while parent:
+            acnt = self.accounts[parent]
+            acnt.s_balance += delta
+            acnt.dirty = True
+            parent = acnt.parent
 
     def load_journal_entries(self, list_of_journal_entries): 
         """
         LineItem => LineEntrys
         Posts journal entries to the ledger.
+        Posting is a delta operation: only the accounts touched by
+        the entries (and their enclosing place holder accounts) are
+        updated, and the trial_balance running totals keep the
+        balance check to a constant cost per entry.
         """
-        # Populate accounts with entries...
+        accounts = self.accounts
         for je in list_of_journal_entries:
+            entry_totals = dict(D= 0, C= 0)
             for line_entry in je.line_entries:
-                if line_entry.account_code not in self.code_set:
+                account = accounts.get(line_entry.account_code)
+                if account is None:
                     logging.error(
                     "Journal entry #%s: unrecognized AcntCode '%s'.",
                         je.entry_number, line_entry.account_code)
-                else:
-                    self.accounts[
-                    line_entry.account_code].line_items.append(
-                            LineItem(je.entry_number,
+                    continue
+                signed_balance = account.signed_balance
+                account.post(LineItem(je.entry_number,
                                         line_entry.type_,
-                                            line_entry.amount,
-                                    )                         )
-        # All jounal entries have now been posted but
-        # the ledger still needs to be 'cleaned up.'
-        totals = dict(d= 0, c= 0)
-        for code in self.ordered_codes:
-            # Populate the accounts with balances, specify Dr or Cr,
-            # and do a running total to check that all is in balance.
-            account = self.accounts[code]
-            account.update_balance()  # Ignores place holder accounts.
-            if (account.acnt_type != 'place_holder'
-            and account.type_
-            and account.type_ in 'dc'):
-                totals[account.type_] += account.balance
-        imbalance = totals['d'] - totals['c']
-        if abs(imbalance)>config.EPSILON:
+                                        cents=line_entry.cents))
+                if account.signed_balance != signed_balance:
+                    self._adjust_subtotals(account.code,
+                        account.signed_balance - signed_balance)
+                entry_totals[line_entry.type_] += line_entry.cents
+            if entry_totals['D'] != entry_totals['C']:
+                logging.critical(
+                    "Journal entry #%s out of balance: Dr - Cr = %s.",
+                        je.entry_number, money.dollars(
+                            entry_totals['D'] - entry_totals['C']))
+            self.trial_balance['D'] += entry_totals['D']
+            self.trial_balance['C'] += entry_totals['C']
+        imbalance = self.trial_balance['D'] - self.trial_balance['C']
+        if imbalance:
             logging.critical(
-                "Balance sheet out of balance: Dr - Cr = %.2f.",
-                        imbalance)
-        self._set_place_holder_signed_balances()
+                "Balance sheet out of balance: Dr - Cr = %s.",
+                        money.dollars(imbalance))
 
-    def sum_accounts(self, account_codes):
+    def save_checkpoint(self, journal):
+        """
+        Persists the balance (and its D/C type_) of every account
+        along with the number of the last journal entry they reflect
+        and a digest of the journal file up to and including that
+        entry.  Assumes all of journal's entries have been loaded
+        into self.  Nothing is written (and False is returned) if
+        the journal has unsaved entries.
+        """
+        if journal.n_saved != len(journal.journal):
+            return False
+        last_entry = journal.last_entry_number
+        size = os.path.getsize(journal.journal_file)
+        balances = {code: [account.balance, account.type_]
+                for code, account in self.accounts.items()
+                    if not account.place_holder and account.type_}
+        atomic_write(self.checkpoint_file, json.dumps(dict(
+                    format=CHECKPOINT_FORMAT,
+                    entry_number=last_entry,
+                    journal_size=size,
+                    journal_digest=file_digest(
+                                    journal.journal_file, size),
+                    balances=balances,
+                    )))
+        return True
+
+    def load_checkpoint(self, journal):
+        """
+        If there is a checkpoint (see save_checkpoint) and the
+        journal entries it reflects are unchanged, the balances it
+        holds are brought forward into the accounts and the number
+        of the last entry reflected is returned: only entries after
+        it remain to be loaded (with load_journal_entries.)
+        Returns 0 (and brings nothing forward) if there is no
+        usable checkpoint.
+        The entries reflected are checked against a digest of the
+        journal file up to the checkpoint, so the whole of that part
+        of the file is read (even for a lazy journal) though not
+        parsed.
+        If posting detail is later shown, it is filled in from the
+        journal (see fill_in_brought_forward.)
+        """
+        try:
+            with open(self.checkpoint_file, 'r') as f_object:
+                checkpoint = json.load(f_object)
+        except (OSError, ValueError):
+            return 0
+        size = checkpoint.get('journal_size', 0)
+        if (checkpoint.get('format') != CHECKPOINT_FORMAT
+        or size > os.path.getsize(journal.journal_file)
+        or file_digest(journal.journal_file, size)
+                                != checkpoint['journal_digest']
+        or not set(checkpoint['balances']) <= self.code_set):
+            logging.info(
+                "Checkpoint '%s' is out of date; not used.",
+                        self.checkpoint_file)
+            return 0
+        for code, (balance, type_) in checkpoint['balances'].items():
+            account = self.accounts[code]
+            signed_balance = account.signed_balance
+            if type_ == 'D':
+                account.brought_forward = balance
+            else:
+                account.brought_forward = -balance
+            account._set_balance()
+            self._adjust_subtotals(code,
+                        account.signed_balance - signed_balance)
+            self.trial_balance[type_] += balance
+        self.brought_forward = (journal, checkpoint['entry_number'])
+        return checkpoint['entry_number']
+
+    def fill_in_brought_forward(self):
+        """
+        Replaces balances brought forward from a checkpoint (see
+        load_checkpoint) with the postings of the journal entries
+        they reflect, so the ledger is as if all the entries had
+        been loaded: called before rendering posting detail.
+        Balances do not change.
+        """
+        journal, last_entry = self.brought_forward
+        if not last_entry:
+            return
+        postings = {}
+        for je in journal:
+            if je.entry_number > last_entry:
+                break
+            for line_entry in je.line_entries:
+                if line_entry.account_code in self.code_set:
+                    postings.setdefault(line_entry.account_code,
+                                        []).append(LineItem(
+                                je.entry_number, line_entry.type_,
+                                cents=line_entry.cents))
+        for code, line_items in postings.items():
+            account = self.accounts[code]
+            line_items.extend(account.line_items)
+            if isinstance(account.line_items, PostingColumns):
+                columns = PostingColumns()
+                for line_item in line_items:
+                    columns.append(line_item)
+                line_items = columns
+            account.line_items = line_items
+            account.brought_forward = 0
+            account.update_balance()
+        self.brought_forward = (None, 0)
+
+    def codes_in_range(self, first, last):
+        """
+        Returns a list of the account codes (strings) whose numeric
+        values are from first to last inclusive, in numeric order.
+        """
+        return self._codes_by_number[
+                bisect.bisect_left(self._code_numbers, first):
+                bisect.bisect_right(self._code_numbers, last)]
+
+    def sum_accounts(self, account_codes, as_of=None):
         """        -test: see class Ledger in tests/test1.py
         Parameter can be a list of account_codes (as numbers or
         strings) or a string with two account codes separated by a
         dash (-) representing a range of accounts.
-        Returns the sum of all the non place holder balances.
+        Returns the sum of all the non place holder balances (in
+        cents.)
         Cr values are considered negative if in a Debit account and
         Dr values are considered negative if in a Credit account.
         self.sum_accounts(4000-5999) will return Net Income.
+        If as_of (a date) is given, balances are as of that date
+        (see Journal.balance_as_of) which requires that the journal
+        attribute be set.
+        Sums of ranges (without as_of) are cached until a balance
+        changes (see the generation attribute.)
         """
 #       print("Calling ChartOfAccounts.sum_accounts({})."
 #                   .format(account_codes))
+        key = None
         if isinstance(account_codes, str):
             split = account_codes.split(
                             config.ACCOUNT_RANGE_INDICATOR)
-            codes = []
             if len(split) != 2:
                 logging.critical(
             "ChartOfAccounts.sum_accounts({}): bad parameter."
@@ -682,9 +1174,12 @@ class ChartOfAccounts(object):
                 return 0
             first = int(split[0])
             last = int(split[1])
-            for code in self.ordered_codes:
-              if int(code) >= first and int(code) <= last:
-                  codes.append(code)
+            if as_of is None:
+                key = (first, last)
+                generation, ret = self._range_sums.get(key, (None, 0))
+                if generation == self.generation:
+                    return ret
+            codes = self.codes_in_range(first, last)
         elif isinstance(account_codes, list):
             codes = account_codes
         else:
@@ -692,68 +1187,179 @@ class ChartOfAccounts(object):
             "ChartOfAccounts.sum_accounts({}): bad parameter."
                         .format(account_codes))
         ret = 0
+        if as_of is not None:
+            if self.journal is None:
+                logging.critical(
+            "ChartOfAccounts.sum_accounts: as_of requires a journal.")
+                return 0
+            ordinal = date.ordinal_from_entry(as_of)
+            if ordinal is None:
+                logging.critical(
+            "ChartOfAccounts.sum_accounts: bad as_of date '%s'.", as_of)
+                return 0
+            for code in codes:
+                code = str(code)
+                acnt = self.accounts[code]
+                if not acnt.place_holder:
+                    balance = self.journal.balance_index.balance_as_of(
+                                                        code, ordinal)
+                    if acnt.normal_type == 'D':
+                        ret += balance
+                    else:
+                        ret -= balance
+            return ret
         for code in codes:
             acnt = self.accounts[str(code)]
             if not acnt.place_holder:
                 ret += acnt.signed_balance
 #               print("Adding balance for acnt#{}: {:.2f}"
+        if key:
+            self._range_sums[key] = (self.generation, ret)
         return ret
 
     def get_net_income(self):
         return  (self.sum_accounts(config.INCOME_RANGE)
                 - self.sum_accounts(config.EXPENSE_RANGE))
 
-    def show_accounts(self):
-        """Returns a string representation of the Ledger.
+    def _kept_report(self, key, parts):
         """
-        ret = ["\nLEDGER/CHART of ACCOUNTS:......  Entity: '{}'\n"
-            .format(self.entity)]
+        A generator of the parts of a report: if the last report
+        shown had the same key (report type, verbosity, period) and
+        no balance has changed since (see the generation attribute)
+        its text is all there is, otherwise parts are passed on and
+        their text kept in its place.  Only the one report is kept.
+        """
+        last = self._last_report
+        if last is not None and last[:2] == (key, self.generation):
+            yield last[2]
+            return
+        shown = []
+        for part in parts:
+            shown.append(part)
+            yield part
+        self._last_report = (key, self.generation, '\n'.join(shown))
+
+    def iter_show_accounts(self):
+        """
+        A generator of the parts (to be joined by new lines) of the
+        string representation of the Ledger: see show_accounts and
+        write_joined.  Each account's part is kept by the account
+        (see Account.show_account) so only accounts changed since
+        the last report are rendered again, and the whole of the
+        last report is kept while nothing changes (see
+        _kept_report.)
+        """
+        return self._kept_report(('accounts', self.verbosity),
+                                 self._iter_accounts())
+
+    def _iter_accounts(self):
+        if self.verbosity > 1:  # Posting detail is shown.
+            self.fill_in_brought_forward()
+        yield ("\nLEDGER/CHART of ACCOUNTS:......  Entity: '{}'\n"
+            .format(self.entity))
         for code in self.ordered_codes:
             text2show = (
                     self.accounts[code].show_account(self.verbosity))
-            if text2show: ret.append(text2show)
+            if text2show: yield text2show
 #           logging.debug("Signed balance Acnt %s: %.2f",
 #               code, self.accounts[code].signed_balance)
-        ret.append("\nNET INCOME: ${:.2f}"
-                .format(self.get_net_income()))
-        return '\n'.join(ret)
+        yield ("\nNET INCOME: ${}"
+                .format(money.dollars(self.get_net_income())))
 
-    def show_balance_sheet(self, date):
-        """Returns the balance sheet as a string.
+    def show_accounts(self):
+        """Returns a string representation of the Ledger.
+        """
+        return '\n'.join(self.iter_show_accounts())
+
+    def iter_show_balance_sheet(self, date):
+        """
+        A generator of the parts (to be joined by new lines) of the
+        balance sheet: see show_balance_sheet and write_joined.
         """
-        ret = ["{:^60}".format(self.entity),
-               "{:^60}".format("Balance Sheet"),
-               "{:^60}".format(date),
-            ]
+        return self._kept_report(
+                        ('balance sheet', self.verbosity, date),
+                        self._iter_balance_sheet(date))
+
+    def _iter_balance_sheet(self, date):
+        if self.verbosity > 1:  # Posting detail is shown.
+            self.fill_in_brought_forward()
+        yield "{:^60}".format(self.entity)
+        yield "{:^60}".format("Balance Sheet")
+        yield "{:^60}".format(date)
         for code in self.ordered_codes:
-            if account_category(code) in config.BALANCE_SHEET_ACCOUNT:
-                text2show = (
-                        self.accounts[code].show_account(self.verbosity))
-                if text2show: ret.append(text2show)
+            acnt = self.accounts[code]
+            if acnt.category in config.BALANCE_SHEET_ACCOUNTS:
+                text2show = acnt.show_account(self.verbosity)
+                if text2show: yield text2show
     #           logging.debug("Signed balance Acnt %s: %.2f",
     #               code, self.accounts[code].signed_balance)
-        return '\n'.join(ret)
+
+    def show_balance_sheet(self, date):
+        """Returns the balance sheet as a string.
+        """
+        return '\n'.join(self.iter_show_balance_sheet(date))
+
+    def for_period(self, journal, begin, end):
+        """
+        Returns a new ChartOfAccounts (same entity) into which
+        only journal's entries dated from begin to end (inclusive)
+        have been loaded.  See Journal.entries_in_period.
+        """
+        ledger = ChartOfAccounts(self.defaults)
+        ledger.load_journal_entries(
+                        journal.entries_in_period(begin, end))
+        return ledger
 
     def show_income_statement(self,
                               begin = config.FISCAL_YEAR_BEGIN,
-                                end = config.FISCAL_YEAR_END):
+                                end = config.FISCAL_YEAR_END,
+                            journal = None):
         """Returns the income statement as a string.
+        Only the entries of journal (by default the journal
+        attribute) dated within the period are taken into account
+        (see for_period;) if there is no journal the accounts are
+        shown as they are.
+        """
+        return '\n'.join(self.iter_show_income_statement(
+                                                begin, end, journal))
+
+    def iter_show_income_statement(self,
+                              begin = config.FISCAL_YEAR_BEGIN,
+                                end = config.FISCAL_YEAR_END,
+                            journal = None):
+        """
+        A generator of the parts (to be joined by new lines) of the
+        income statement: see show_income_statement and
+        write_joined.  The journal's entries are counted in with
+        the period to tell whether the kept report (see
+        _kept_report) still holds.
         """
+        if journal is None:
+            journal = self.journal
+        key = ('income statement', self.verbosity, begin, end,
+                None if journal is None else (id(journal), len(journal)))
+        return self._kept_report(key,
+                    self._iter_income_statement(begin, end, journal))
+
+    def _iter_income_statement(self, begin, end, journal):
+        if journal is None:
+            if self.verbosity > 1:  # Posting detail is shown.
+                self.fill_in_brought_forward()
+            ledger = self
+        else:
+            ledger = self.for_period(journal, begin, end)
         fiscal_period = "For Fiscal Period {} to {}".format(
-                                                begin, end),
-        ret = ["{:^60}".format(self.entity),
-               "{:^60}".format("Income Statement"),
-               "{:^60}".format(fiscal_period),
-            ]
-        for code in self.ordered_codes:
-            if account_category(code) in config.INCOME_STATEMENT_ACCOUNT:
-                text2show = (
-                        self.accounts[code].show_account(self.verbosity))
-                if text2show: ret.append(text2show)
+                                                begin, end)
+        yield "{:^60}".format(self.entity)
+        yield "{:^60}".format("Income Statement")
+        yield "{:^60}".format(fiscal_period)
+        for code in ledger.ordered_codes:
+            acnt = ledger.accounts[code]
+            if acnt.category in config.INCOME_STATEMENT_ACCOUNTS:
+                text2show = acnt.show_account(self.verbosity)
+                if text2show: yield text2show
     #           logging.debug("Signed balance Acnt %s: %.2f",
-    #               code, self.accounts[code].signed_balance)
-        return '\n'.join(ret)
-        return ret
+    #               code, ledger.accounts[code].signed_balance)
 
 def total_reversal(self, account_category, total):
     """
@@ -767,7 +1373,7 @@ def total_reversal(self, account_category, total):
         balance = acnt.balance
         if (acnt.type_[:1] in 'DC') and (balance):
             total += balance
-            line_entries.append(LineEntry(code, drcr, balance))
+            line_entries.append(LineEntry(code, drcr, cents=balance))
     return line_entries
 
 
@@ -776,35 +1382,51 @@ def total_reversal(self, account_category, total):
 class LineEntry(object):
     """
     ineEntry: the individual line_entries of each JournalEntry.
-    Attributes are account_code, type_ (dr or cr), and amount.
-    type_ is converted to 'D' or 'C'.
+    Attributes are account_code, type_ (dr or cr), and cents.
+    type_ is converted to 'D' or 'C'; amounts are kept as an int
+    number of cents.
     Provides the following methods:
     _dict: @property- returns a dict (for json compatibility.)
     show == __str__
     list_from_text: a class method, returns a list of instances
     get_LineEntry: a class method, interactively returns an instance.
     balanced_LineEntry_list: a class method, returns True or False.
+    Instances are slotted (no per instance __dict__) to keep them
+    small.
     """
 
-    def __init__(self, account_code, type_, amount):
+    __slots__ = ('account_code', 'type_', 'cents')
+
+    def __init__(self, account_code, type_, amount=None, cents=None):
         """
         Does validity checking.
+        The value can be given in dollars (amount) or, as it is
+        kept, in cents.
         """
         assert config.valid_account_code(account_code)
         self.account_code = account_code
         self.type_ = type_[:1].upper()
         assert self.type_ in 'DC'
         try:
-            self.amount = float(amount)
-        except ValueError:
+            if cents is None:
+                cents = money.to_cents(amount)
+            self.cents = int(cents)
+        except (ValueError, TypeError):
             logging.warning("LineEntry({}, {}, {}), bad last param."
                 .format(account_code, type_, amount))
             raise
 
+    @property
+    def amount(self):
+        """
+        The value in dollars (a float:) for display only.
+        """
+        return self.cents / 100
+
     def __eq__(self, other):
         return (self.account_code == other.account_code
             and self.type_ == other.type_
-            and self.amount == other.amount)
+            and self.cents == other.cents)
 
     @classmethod     # LineEntry
     def old_list_from_text(cls, line):
@@ -861,7 +1483,7 @@ class LineEntry(object):
         return ret
 
     @classmethod     # LineEntry
-    def list_from_text(cls, line):
+    def list_from_text(cls, line, scanned=None):
         """     
         Accepts a string with the following three white space
         separated components: account_code, type_, & amount.
@@ -874,14 +1496,21 @@ class LineEntry(object):
         The components can appear in any order.
         Returns a list of LineEntry instances (or None if parsing
         is unsuccessful.)
+        scanned: what scan_line_entry returned for line (if the
+        caller has already called it.)
         """
         if not line: return
         abort = False
         ret = []
-        value = money.get_currency_value(line,
-                debug=DEBUG)
-        accounts = config.get_list_of_accounts(line)
-        type_ = drcr.drcr(line)
+        if scanned is None:
+            scanned = scan_line_entry(line)
+        if scanned:
+            value, accounts, type_ = scanned
+        else:  # Not in the usual form.
+            value = money.get_currency_cents(line,
+                    debug=DEBUG)
+            accounts = config.get_list_of_accounts(line)
+            type_ = drcr.drcr(line)
         for item, report in (
                 (value, "no dollar amount"),
                 (accounts, "no account(s) entered"),
@@ -895,9 +1524,9 @@ class LineEntry(object):
         if abort == True:
             return
         
-        values = divider(value, len(accounts))
+        values = divide_cents(value, len(accounts))
         for (account, value) in zip(accounts, values):
-            ret.append(LineEntry(account, type_, value))
+            ret.append(LineEntry(account, type_, cents=value))
         return ret
 
     @property       # LineEntry
@@ -906,20 +1535,34 @@ class LineEntry(object):
         Returns a dictionary representation of a LineEntry.
         """
         return dict(account_code=self.account_code,
-                    amount=self.amount,
+                    cents=self.cents,
                     type_=self.type_)
 
+    @classmethod       # LineEntry
+    def from_dict(cls, _dict):
+        """      a classmethod
+        Converse of _dict: the fast path used when loading the
+        journal.  The validity checking done by __init__ is skipped
+        since what was saved was checked when it was entered.
+        Accepts dicts saved before cents were kept (with an amount,
+        in dollars, instead.)
+        """
+        line_entry = cls.__new__(cls)
+        line_entry.account_code = _dict["account_code"]
+        line_entry.type_ = _dict["type_"][:1].upper()
+        cents = _dict.get("cents")
+        if cents is None:
+            cents = money.to_cents(_dict["amount"])
+        line_entry.cents = cents
+        return line_entry
+
     def show(self):
         """
         Returns a string version of a LineEntry instance.
         Output format puts account type_ at end.
         """
-        if self.type_ == 'D': spacer = 12
-        if self.type_ == 'C': spacer = 26
-        format_string = "      {{}}:{{:>{}.2f}}{{}}r".format(spacer)
-        return format_string .format(self.account_code,
-                                    self.amount,
-                                    self.type_)
+        return LINE_ENTRY_FORMATS[self.type_](self.account_code,
+                                        money.dollars(self.cents))
     def __str__(self):
         return self.show()
 
@@ -939,8 +1582,8 @@ class LineEntry(object):
     def balanced_LineEntry_list(cls, list_of_LineEntrys):
         """
         Returns True if list_of_LineEntrys is balanced.
-        i.e. if Debits equal Credits.  Else returns False.
-        Used for sanity checking.
+        i.e. if Debits equal Credits (to the cent.)  Else returns
+        False.  Used for sanity checking.
         """
         totals = dict(D= 0,
                       C= 0)
@@ -948,14 +1591,17 @@ class LineEntry(object):
 #           print(             # debugging print
 #               "line_entry is type '{}': '{}'"
 #               .format(type(line_entry), line_entry))
-            totals[line_entry.type_] += line_entry.amount
-        return (totals['D'] - totals['C']) < config.EPSILON
+            totals[line_entry.type_] += line_entry.cents
+        return totals['D'] == totals['C']
 
 class JournalEntry(object):
     """
     JournalEntry objects have the following attributes:
             entry_number: int but displayed as a formatted string.
             date_stamp: date_stamp,  # string- any format
+            ordinal: the date_stamp's day number (see
+                src.date.ordinal_from_entry) or None: for
+                comparisons and sorting.
             user: name,  # person making the journal entry
             description: explanation, # string with imbedded '\n's.
             line_entries: list of LineEntry objects
@@ -966,19 +1612,30 @@ class JournalEntry(object):
     from_dict: converse of _dict- takes dict, returns instance.
     show == __str__
     get_JournalEntry: interactive class method, returns an instance.
+    Instances are slotted (no per instance __dict__) to keep them
+    small.
     """
+
+    __slots__ = ('entry_number', 'date_stamp', 'ordinal', 'user',
+                'description', 'line_entries')
     
     def __init__(self,  entry_number,
                         date_stamp,
                         user,
                         description,
-                        line_entries  # list of LineEntry instances
+                        line_entries,  # list of LineEntry instances
+                        ordinal=None
                         ):
         """
         Creates a JournalEntry instance from its 5 parameters.
+        ordinal (if not provided, as it is when loading a saved
+        entry) is derived from date_stamp.
         """
         self.entry_number = int(entry_number)
         self.date_stamp = date_stamp
+        if ordinal is None:
+            ordinal = date.ordinal_from_entry(date_stamp)
+        self.ordinal = ordinal
         self.user = user
         self.description = description
         self.line_entries = line_entries
@@ -986,18 +1643,17 @@ class JournalEntry(object):
     def show(self):
         """
         Presents a printable version of a journal entry.
+        Formats straight from the attributes (see
+        LINE_ENTRY_FORMATS and JOURNAL_ENTRY_HEADER.)
         """
-        _dict = self._dict
-        ret = []
-        ret.append(
-            "  #{entry_number:0>3} on {date_stamp:<12} by {user}."
-            .format(**_dict))
-
-        description_lines = _dict["description"].split('\n')
-        for line in description_lines:
-            ret.append("    {}".format(line))
-        for line_entry in _dict["line_entries"]:
-            ret.append(LineEntry(**line_entry).show())
+        ret = [JOURNAL_ENTRY_HEADER(self.entry_number,
+                                    self.date_stamp, self.user)]
+        for line in self.description.split('\n'):
+            ret.append("    " + line)
+        for line_entry in self.line_entries:
+            ret.append(LINE_ENTRY_FORMATS[line_entry.type_](
+                        line_entry.account_code,
+                        money.dollars(line_entry.cents)))
         return '\n'.join(ret)
 
     def __str__(self):
@@ -1010,6 +1666,7 @@ class JournalEntry(object):
         """
         return dict(entry_number=self.entry_number,
                     date_stamp=self.date_stamp,
+                    ordinal=self.ordinal,
                     user=self.user,
                     description=self.description,
                     line_entries=[
@@ -1022,14 +1679,18 @@ class JournalEntry(object):
         Takes the dict version and returns an instance.
         Need this because list of LineEntry objects must
         also be converted from corresponding dicts.
+        The instance is built straight from _dict (which is left
+        unchanged) without copying it.
         """
 #       print("Calling JournalEntry.from_dict(_dict) on:\n{}"
 #               .format(_dict))
-        dict_copy = copy.deepcopy(_dict)
-        # Make a copy to prevent side effect.
-        dict_copy["line_entries"] = [
-                LineEntry(**item) for item in _dict["line_entries"]]
-        return JournalEntry(**dict_copy)
+        return cls(_dict["entry_number"],
+                    _dict["date_stamp"],
+                    _dict["user"],
+                    _dict["description"],
+                    [LineEntry.from_dict(item)
+                        for item in _dict["line_entries"]],
+                    _dict.get("ordinal"))  # Absent from old entries.
 
     @classmethod       # JournalEntry
     def get_JournalEntry(cls):
@@ -1107,6 +1768,35 @@ class JournalEntry(object):
         'debk/tests/debk.d/testEntityJournal_input0'.
         NB: There is noo user approval mechanism for this form of
         journal entry.
+        See iter_load for large files.
+        """
+        return list(cls.iter_load(text_or_filename))
+
+    @classmethod       # JournalEntry
+    def iter_load(cls, text_or_filename, processes=1):
+        """     
+        A generator version of load: yields the JournalEntry
+        instances one at a time as they are parsed.  A file is read
+        a line at a time so neither it nor the entries parsed from
+        it need be held in memory.
+        If processes is more than 1, parsing is shared out amongst
+        that many processes (see iter_load_parallel.)
+        """
+        if processes > 1:
+            yield from iter_load_parallel(text_or_filename, processes)
+            return
+        for journal_entry, accepted in cls.parse_lines(
+                                    input_lines(text_or_filename)):
+            if accepted:
+                yield journal_entry
+
+    @classmethod       # JournalEntry
+    def parse_lines(cls, lines, report=True):
+        """
+        Does the work for iter_load: generates a (JournalEntry,
+        accepted) tuple for each entry (blank line terminated group
+        of lines) in lines, accepted being what its ok method
+        returned.  (Passed report, which if False silences ok.)
         """
 
         def initialize():                                  # Helper
@@ -1119,19 +1809,10 @@ class JournalEntry(object):
                         line_entries = [],                    #
                         )                                  #
 
-        if os.path.isfile(text_or_filename):               # collect
-            with open(text_or_filename, 'r') as f:         # text
-                raw_data = f.read()                        # i.e.
-        else:                                              # raw
-            raw_data = text_or_filename                    # data
-        data = raw_data.split('\n')                        #
-
-        ret = []   # To collect journal_entries.
-
         # Initialize what will potentially be the first entry...
         new_dict = initialize()
 
-        for line in data:
+        for line in lines:
             line = line.strip()
             if not line:  # Blank line.
                 # Assume have collected a journal entry so ...
@@ -1143,14 +1824,8 @@ class JournalEntry(object):
                 new_je = JournalEntry(**new_dict)
 #               print(  # debugging print
 #                   "\nEntry being considered: ".format(new_je))
-                if new_je.ok():
-#                   print(  # debugging print
-#                       "JE passed: {}".format(new_je.show()))
-                    ret.append(new_je)
-                else:
-                    pass
-#                   print(  # debugging print
-#                   "Expect to fail after last JE is collected.")
+                yield new_je, new_je.ok(report)
+#               Expect to fail after last JE is collected.
                 new_dict = initialize()
                 continue
             # Not a blank line.
@@ -1158,11 +1833,14 @@ class JournalEntry(object):
 #               print(  # debugging print
 #                  "setting date_stamp to '{}'".format(line))
                 new_dict['date_stamp'] = date.check_date(line)
-            elif not new_dict['user']:
+                continue
+            if not new_dict['user']:
 #               print(   # debugging print
 #                  "setting user to '{}'".format(line))
                 new_dict['user'] = line
-            elif not drcr.drcr(line):
+                continue
+            scanned = scan_line_entry(line)
+            if not (scanned or drcr.drcr(line)):
 #               print(  # debugging print
 #                  "Appending description: '{}'".format(line))
                 new_dict['description'].append(line)
@@ -1170,7 +1848,8 @@ class JournalEntry(object):
                 # Note: might be of the form 1010,1011,1012 Cr 4.50
 #               print("DEBUG: line: '{}'.".format(line))
 #               print(LineEntry.list_from_text(line).show())
-                for line_entry in LineEntry.list_from_text(line):
+                for line_entry in LineEntry.list_from_text(line,
+                                                        scanned):
 #                   print("DEBUG: line OK: '{}'.".format(line))
                     if isinstance(line_entry, LineEntry):
 #                       print( # debugging pr
@@ -1180,17 +1859,11 @@ class JournalEntry(object):
                         pass
 #                       print(   # debugging print
 #               "Expect to fail after last line_entry is collected.")
-#       if not ret:   # next 6 lines debugging print
-#           print("\nJournalEntry.load on '{}' => {} (nothing!)"
-#                   .format(text_or_filename, ret))
-#       else:
-#           for journal_entry in ret:
-#               print("\n{}".format(journal_entry.show()))
-        return ret
 
-    def ok(self):
+    def ok(self, report=True):
         """             Tested in ./tests/test2.py JournalEntryTests
         A rigorous self check of a JournalEntry instance.
+        Unless report is False, a rejected entry is printed.
         """
 #       print(show_args(self._dict, 'JournalEntry.ok()'))
         if (isinstance(self.entry_number, int)
@@ -1204,12 +1877,212 @@ class JournalEntry(object):
         and LineEntry.balanced_LineEntry_list(self.line_entries)):
             return True
         else:
-            print("""Rejecting journal entry:
+            if report:
+                print("""Rejecting journal entry:
 {}
 ^^^^^^^^^^ Some rejections are OK (i.e. blank entries.) ^^^^^^^^^^"""
-                .format(self.show()))
+                    .format(self.show()))
             return False
 
+class _LogCollector(logging.Handler):
+    """
+    Used by parse_chunk to collect, rather than emit, log records so
+    that they can be passed back to the parent process.
+    """
+
+    def __init__(self, events):
+        super().__init__()
+        self.events = events
+
+    def emit(self, record):
+        record.msg = record.getMessage()  # Arguments may not
+        record.args = None                # pickle.
+        self.events.append(('log', record))
+
+def parse_chunk(lines):
+    """
+    Run in a worker process by iter_load_parallel: parses lines
+    (a list that begins a new entry) and returns, in order, a list
+    of events: ('log', LogRecord) for what parsing logged,
+    ('entry', JournalEntry._dict, accepted) for each entry (dicts
+    being quicker to pass between processes) and, if parsing
+    failed, ('error', exception) last.
+    """
+    events = []
+    root = logging.getLogger()
+    saved_handlers = root.handlers
+    root.handlers = [_LogCollector(events)]
+    try:
+        for journal_entry, accepted in JournalEntry.parse_lines(
+                                                lines, report=False):
+            events.append(('entry', journal_entry._dict, accepted))
+    except Exception as error:  # Raised by the parent, in order.
+        events.append(('error', error))
+    finally:
+        root.handlers = saved_handlers
+    return events
+
+def input_chunks(text_or_filename, chunk_lines):
+    """
+    Generates lists of (about chunk_lines) lines of input, each
+    (but the last) ending with a blank line so that each list can
+    be parsed independently of the others.
+    """
+    chunk = []
+    for line in input_lines(text_or_filename):
+        chunk.append(line)
+        if len(chunk) >= chunk_lines and not line.strip():
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def iter_load_parallel(text_or_filename, processes, chunk_lines=5000):
+    """
+    A version of JournalEntry.iter_load that parses chunks of input
+    (see input_chunks) in a pool of worker processes.  Results are
+    dealt with in the original order and as in the serial version:
+    accepted entries are yielded, rejected ones printed and what
+    the workers logged is logged again here.
+    Only a few chunks are in flight at once so memory use remains
+    bounded.
+    """
+    in_flight = collections.deque()
+    chunks = input_chunks(text_or_filename, chunk_lines)
+    with concurrent.futures.ProcessPoolExecutor(processes) as pool:
+        while True:
+            for chunk in chunks:
+                in_flight.append(pool.submit(parse_chunk, chunk))
+                if len(in_flight) >= 2 * processes:
+                    break
+            if not in_flight:
+                break
+            for event in in_flight.popleft().result():
+                if event[0] == 'log':
+                    logging.getLogger(event[1].name).handle(event[1])
+                elif event[0] == 'error':
+                    raise event[1]
+                elif event[2]:
+                    yield JournalEntry.from_dict(event[1])
+                else:  # Print the rejection.
+                    JournalEntry.from_dict(event[1]).ok()
+
+def convert_legacy_journal(legacy_file, journal_file):
+    """
+    A one time converter: reads a journal kept in the old format
+    (a json file consisting of a dict with only one entry keyed by
+    "Journal" with a value that is a list of JournalEntry dicts) and
+    writes it to journal_file in JSON Lines format (one dict per
+    line.)  The legacy file is left as is.
+    Returns the number of entries converted.
+    """
+    with open(legacy_file, 'r') as f_object:
+        list_of_dicts = json.load(f_object)["Journal"]
+    atomic_write(journal_file, ''.join(
+            [json.dumps(_dict) + '\n' for _dict in list_of_dicts]))
+    logging.info("Converted %d entries from '%s' to '%s'.",
+                    len(list_of_dicts), legacy_file, journal_file)
+    return len(list_of_dicts)
+
+class DateIndex(object):
+    """
+    Journal entry numbers kept in date order (ordinals, see
+    JournalEntry) so that the entries of any period can be found
+    by bisection: the cost is in proportion to the number of
+    entries in the period rather than to the size of the journal.
+    Entries without a (valid) date are left out.
+    Attributes:
+        ordinals: sorted list of the entries' ordinals.
+        entry_numbers: the corresponding entry numbers.
+    """
+
+    def __init__(self):
+        self.ordinals = []
+        self.entry_numbers = []
+
+    def __len__(self):
+        return len(self.ordinals)
+
+    def add(self, entry_number, ordinal):
+        """
+        Entries are usually added in date order so go at the end;
+        others are inserted (after any of the same date.)
+        """
+        if ordinal is None:
+            return
+        if not self.ordinals or ordinal >= self.ordinals[-1]:
+            self.ordinals.append(ordinal)
+            self.entry_numbers.append(entry_number)
+        else:
+            position = bisect.bisect_right(self.ordinals, ordinal)
+            self.ordinals.insert(position, ordinal)
+            self.entry_numbers.insert(position, entry_number)
+
+    def entry_numbers_in(self, first, last):
+        """
+        Returns, in order, the numbers of the entries dated from
+        ordinal first to ordinal last (inclusive.)  None for either
+        (an unreadable date) gives an empty list.
+        """
+        if first is None or last is None:
+            return []
+        return sorted(self.entry_numbers[
+                    bisect.bisect_left(self.ordinals, first):
+                    bisect.bisect_right(self.ordinals, last)])
+
+class BalanceIndex(object):
+    """
+    The balance of each account as of any date, kept in a binary
+    indexed (Fenwick) tree per account, indexed by date ordinal:
+    adding an entry (whatever its date) and finding a balance as
+    of a date each take O(log(SIZE)) steps.
+    The trees are sparse (dicts) so only nodes on the paths of
+    the dates actually used take up space.
+    Attributes:
+        accounts: a dict keyed by account code, values being the
+            account's tree: a dict keyed by tree node (ordinal
+            based) with partial sums (Dr - Cr, in cents) as values.
+    """
+
+    SIZE = 1 << 22  # More than datetime.date.max.toordinal().
+
+    def __init__(self):
+        self.accounts = {}
+
+    def add(self, journal_entry):
+        """
+        Adds the amounts of journal_entry's line entries to the
+        trees of their accounts.
+        """
+        ordinal = journal_entry.ordinal
+        if ordinal is None:
+            return
+        for line_entry in journal_entry.line_entries:
+            cents = line_entry.cents
+            if line_entry.type_ == 'C':
+                cents = -cents
+            tree = self.accounts.setdefault(line_entry.account_code, {})
+            node = ordinal
+            while node <= self.SIZE:
+                tree[node] = tree.get(node, 0) + cents
+                node += node & -node
+
+    def balance_as_of(self, code, ordinal):
+        """
+        Returns the balance (Dr - Cr, in cents) of account code
+        at the end of the day given by ordinal (0 if ordinal is
+        None: an unreadable date.)
+        """
+        tree = self.accounts.get(code)
+        if not tree or ordinal is None:
+            return 0
+        balance = 0
+        node = min(ordinal, self.SIZE)
+        while node > 0:
+            balance += tree.get(node, 0)
+            node -= node & -node
+        return balance
+
 class Journal(object):
     """
     Deals with the whole journal, providing methods for retrieving it
@@ -1225,20 +2098,32 @@ class Journal(object):
         journal_file: name of the json file (persistent storage.)
         metadata_file: name of file where next_entry is discovered.
         next_entry: discoverd from metadata & incrimented as needed.
-        journal: a list of dicts
-            In persistent storage it is a json file consisting of 
-            a dict with only one entry keyed by "Journal" with a 
-            value that is a list of dicts. The journal attribute
-            becomes this list.  Each item of this list is the dict
-            version of a JournalEntry instance.
+        journal: a list of JournalEntry instances.
+            In persistent storage it is a JSON Lines file: each line
+            is the json version of the dict version (see
+            JournalEntry._dict) of a JournalEntry instance.
+            In lazy mode (see below) it holds only entries not yet
+            saved.
+        n_saved: the number of entries (at the beginning of the
+            journal list) that are already in persistent storage.
+        lazy: if True (defaults['lazy_journal']) saved entries are
+            not loaded; they are parsed from the file as needed.
+        index: (lazy mode only) a dict keyed by the entry_number of
+            each saved entry; values are the byte offset of its
+            line in the journal file.
+        saved_size: the number of bytes of the journal file that
+            have been read or saved.
         metadata: the info sourced from metadata_file
+    Whatever the mode, len(journal), iteration over journal (all
+    entries in entry_number order) and journal[entry_number] work
+    and should be preferred to using the journal attribute.
     Public methods include:
         __init__() - loads data from persistent storage.
         show() - assigned to __str__.
         get() - get new entries from user
         load()- load new entries from text, either a string or text
         collected from a file.
-        save()- save new entries to persistent storage.
+        save()- append new entries to persistent storage.
     NOTE: this class's get_entry and show methods rely on 
     JournalEntry methods get_entry and show.
     """
@@ -1263,19 +2148,220 @@ class Journal(object):
                                         defaults['metadata_name'])
         self.journal_file = os.path.join(dir_name,
                                         defaults['journal_name'])
-        # The json file consists of a dict with only one entry
-        # keyed by "journal" and its value is a list of dicts,
-        # each corresponding to a JournalEntry instance.
-        with open(self.journal_file, 'r') as f_object:
-            persistent_dict = json.load(f_object)
-#           logging.debug(persistent_dict)
-#           print("persistent journal_dict: {}"
-#                       .format(persistent_dict))
-            self.journal = [JournalEntry.from_dict(_dict) for
-                            _dict in persistent_dict["Journal"]]
+        legacy_file = os.path.join(dir_name,
+                    defaults.get('legacy_journal_name', ''))
+        if (not os.path.isfile(self.journal_file)
+        and os.path.isfile(legacy_file)):
+            convert_legacy_journal(legacy_file, self.journal_file)
+        # The JSON Lines file has one line per JournalEntry, each
+        # line being the json version of the entry's dict.
+        self.lazy = defaults.get('lazy_journal', False)
+        self.journal = []
+        self.index = {}
+        torn_line = None
+        with open(self.journal_file, 'rb') as f_object:
+            offset = 0
+            for line in f_object:
+                if not line.endswith(b'\n'):
+                    torn_line = line
+                    break
+                if line.strip():
+                    if self.lazy:
+                        self.index[entry_number_from_line(line)] = (
+                                                            offset)
+                    else:
+                        self.journal.append(JournalEntry.from_dict(
+                                    json.loads(line.decode('utf-8'))))
+                offset += len(line)
+        if torn_line is not None:
+            self._discard_torn_line(offset, torn_line)
+        self.saved_size = offset
+        self.n_saved = len(self.journal)
         with open(self.metadata_file, 'r') as f_object:
             self.metadata = json.load(f_object)
         self.next_entry = self.metadata['next_journal_entry_number']
+        self._recover_metadata()
+        self._date_index = None     # | Built when first
+        self._balance_index = None  # | needed.
+
+    def _discard_torn_line(self, offset, line):
+        """
+        Recovery: every committed journal line ends with a newline
+        so a last line without one is what remains of a save that
+        was interrupted.  It is truncated away (the file is only
+        then opened for writing.)  If the file can not be written
+        (e.g. a read only directory) the line is just ignored.
+        """
+        logging.warning(
+            "Discarding incomplete last line (%d bytes) of '%s'.",
+                len(line), self.journal_file)
+        try:
+            with open(self.journal_file, 'rb+') as f_object:
+                f_object.truncate(offset)
+                f_object.flush()
+                os.fsync(f_object.fileno())
+        except OSError as error:
+            logging.warning("Unable to truncate '%s': %s",
+                            self.journal_file, error)
+
+    def _recover_metadata(self):
+        """
+        Recovery: the journal is appended to (and fsync'ed) before
+        the metadata is replaced, so after a crash between the two
+        the metadata may lag behind the journal.  If so, the
+        metadata is rolled forward to match the journal.
+        """
+        last_entry_number = self.last_entry_number
+        if last_entry_number >= self.next_entry:
+            logging.warning(
+                "Metadata out of step with journal; "
+                + "next_journal_entry_number reset from %d to %d.",
+                    self.next_entry, last_entry_number + 1)
+            self.next_entry = last_entry_number + 1
+            self.metadata['next_journal_entry_number'] = (
+                                                    self.next_entry)
+            try:
+                atomic_write(self.metadata_file,
+                            json.dumps(self.metadata))
+            except OSError as error:  # e.g. a read only directory:
+                # the next save will write the metadata.
+                logging.warning("Unable to update '%s': %s",
+                                self.metadata_file, error)
+                self.changed = True
+
+    @property
+    def last_entry_number(self):
+        """
+        The entry_number of the last entry (0 if there are none.)
+        """
+        if self.journal:
+            return self.journal[-1].entry_number
+        if self.index:
+            return next(reversed(self.index))
+        return 0
+
+    def __len__(self):
+        return len(self.index) + len(self.journal)
+
+    def __iter__(self):
+        return self.entries_after(0)
+
+    def entries_after(self, entry_number):
+        """
+        Generates, in order, the entries numbered higher than
+        entry_number.  In lazy mode saved entries are parsed from
+        the journal file as they are reached and only those needed
+        are parsed.
+        """
+        later = [offset for number, offset in self.index.items()
+                    if number > entry_number]
+        if later:
+            with open(self.journal_file, 'rb') as f_object:
+                f_object.seek(later[0])
+                remaining = self.saved_size - later[0]
+                for line in f_object:
+                    remaining -= len(line)
+                    if remaining < 0:
+                        break
+                    if line.strip():
+                        yield JournalEntry.from_dict(
+                                    json.loads(line.decode('utf-8')))
+        start = bisect.bisect_right(self.journal, entry_number,
+                        key=lambda journal_entry:
+                                journal_entry.entry_number)
+        yield from self.journal[start:]
+
+    def __getitem__(self, entry_number):
+        """
+        Returns the entry numbered entry_number (parsing it from
+        the journal file if in lazy mode and already saved.)
+        Raises KeyError if there is no such entry.
+        """
+        if entry_number in self.index:
+            with open(self.journal_file, 'rb') as f_object:
+                f_object.seek(self.index[entry_number])
+                return JournalEntry.from_dict(
+                    json.loads(f_object.readline().decode('utf-8')))
+        position = bisect.bisect_left(self.journal, entry_number,
+                        key=lambda journal_entry:
+                                journal_entry.entry_number)
+        if (position < len(self.journal) and
+        self.journal[position].entry_number == entry_number):
+            return self.journal[position]
+        raise KeyError(entry_number)
+
+    @property
+    def date_index(self):
+        """
+        A DateIndex of all the entries: built (from the ordinals
+        alone in lazy mode) the first time it is needed and then
+        kept up to date by append.
+        """
+        if self._date_index is None:
+            self._date_index = DateIndex()
+            if self.index:
+                first = next(iter(self.index.values()))
+                with open(self.journal_file, 'rb') as f_object:
+                    f_object.seek(first)
+                    remaining = self.saved_size - first
+                    for line in f_object:
+                        remaining -= len(line)
+                        if remaining < 0:
+                            break
+                        if line.strip():
+                            self._date_index.add(
+                                entry_number_from_line(line),
+                                ordinal_from_line(line))
+            for journal_entry in self.journal:
+                self._date_index.add(journal_entry.entry_number,
+                                    journal_entry.ordinal)
+        return self._date_index
+
+    @property
+    def balance_index(self):
+        """
+        A BalanceIndex of all the entries: built the first time it
+        is needed and then kept up to date by append.
+        """
+        if self._balance_index is None:
+            self._balance_index = BalanceIndex()
+            for journal_entry in self:
+                self._balance_index.add(journal_entry)
+        return self._balance_index
+
+    def balance_as_of(self, code, as_of):
+        """
+        Returns the balance (Dr - Cr, in cents) of account code
+        at the end of the day as_of (a datetime.date or string, see
+        src.date.ordinal_from_entry) according to the journal.
+        Logs and returns 0 if as_of can not be read.
+        """
+        ordinal = date.ordinal_from_entry(as_of)
+        if ordinal is None:
+            logging.critical(
+                "Journal.balance_as_of: bad date '%s'.", as_of)
+            return 0
+        return self.balance_index.balance_as_of(code, ordinal)
+
+    def entries_in_period(self, begin, end):
+        """
+        Generates, in order, the entries dated from begin to end
+        (inclusive.)  begin and end may be datetime.date instances
+        or strings (see src.date.ordinal_from_entry.)
+        Uses date_index: only the entries in the period are looked
+        at (or, in lazy mode, read.)
+        Nothing is generated if either date is unreadable.
+        """
+        first = date.ordinal_from_entry(begin)
+        last = date.ordinal_from_entry(end)
+        for entry, ordinal in ((begin, first), (end, last)):
+            if ordinal is None:
+                logging.critical(
+                    "Journal.entries_in_period: bad date '%s'.", entry)
+                return
+        entry_numbers = self.date_index.entry_numbers_in(first, last)
+        for entry_number in entry_numbers:
+            yield self[entry_number]
 
     def append(self, journal_entry):
         """
@@ -1285,6 +2371,11 @@ class Journal(object):
         journal_entry.entry_number = self.next_entry
         self.next_entry += 1
         self.journal.append(journal_entry)
+        if self._date_index is not None:
+            self._date_index.add(journal_entry.entry_number,
+                                journal_entry.ordinal)
+        if self._balance_index is not None:
+            self._balance_index.add(journal_entry)
         self.changed = True
 
     def extend(self, journal_entries):
@@ -1292,16 +2383,24 @@ class Journal(object):
             self.append(journal_entry)
         self.changed = True
 
+    def iter_show(self):
+        """
+        A generator of the parts (to be joined by new lines) of the
+        string representation of the journal: one per entry, read
+        as needed (see __iter__) so that writing them out (see
+        write_joined) takes the same memory however long the
+        journal.
+        """
+        yield ("\nJOURNAL ENTRIES:......           Entity: '{}'\n"
+            .format(self.entity))
+        for je in self:
+            yield je.show()
+
     def show(self):
         """
         Returns a string representation of the journal attribute.
         """
-
-        ret = ["\nJOURNAL ENTRIES:......           Entity: '{}'\n"
-            .format(self.entity)]
-        for je in self.journal:
-            ret.append(je.show())
-        return '\n'.join(ret)
+        return '\n'.join(self.iter_show())
 
     def __str__(self):
         """
@@ -1312,24 +2411,54 @@ class Journal(object):
     def save(self):
         """
         Saves journal to persistent storage.
-        Replaces, rather than adds to, what was previously in
-        persistent storage.  What was previously stored is loaded
-        when a Journal is instantiated so data will not be lost.
+        Only entries added since the last save (or since
+        instantiation) are written: they are appended, one line
+        each, to the JSON Lines journal file.
+        Commit protocol: all the new lines are appended in a single
+        write and fsync'ed; only then is the metadata replaced (see
+        atomic_write.)  Any number of entries can therefore be
+        batched into one save.  A crash at any point leaves files
+        that __init__ can recover from.
+        Once fsync'ed the new lines are counted as saved even if
+        replacing the metadata then fails: they are not written
+        again and the metadata is rolled forward by the next save
+        (which rewrites it) or by __init__ (see _recover_metadata.)
+        In lazy mode the saved entries are indexed and then released.
         Returns an error string if unsuccessfull.
         """
         if not self.changed:
             return "No entries to save."
-        persistent_dict = {"Journal":
-                                [je._dict for je in self.journal]}
+        new_entries = self.journal[self.n_saved:]
+        new_lines = [(json.dumps(je._dict) + '\n').encode('utf-8')
+                                for je in new_entries]
         self.metadata['next_journal_entry_number'] = self.next_entry
         try:
-            with open(self.journal_file,
-                            'w', newline='') as f_object:
-                json.dump(persistent_dict, f_object)
-            with open(self.metadata_file, 'w') as f_object:
-                json.dump(self.metadata, f_object)
+            with open(self.journal_file, 'ab') as f_object:
+                committed_size = f_object.tell()
+                try:
+                    f_object.write(b''.join(new_lines))
+                    f_object.flush()
+                    os.fsync(f_object.fileno())
+                except IOError:
+                    f_object.truncate(committed_size)
+                    raise
         except IOError:
             return "Encountered an IOError; journal NOT saved."
+        offset = committed_size
+        for je, line in zip(new_entries, new_lines):
+            if self.lazy:
+                self.index[je.entry_number] = offset
+            offset += len(line)
+        self.saved_size = offset
+        if self.lazy:
+            self.journal = []
+        self.n_saved = len(self.journal)
+        try:
+            atomic_write(self.metadata_file, json.dumps(self.metadata))
+        except IOError:
+            # self.changed is left set so that save is tried again.
+            return "Encountered an IOError; metadata NOT saved."
+        self.changed = False
 
 #   def _get_entry(self):
 #       """Used by the get method to add an entry to the the journal.
@@ -1383,9 +2512,11 @@ class Journal(object):
         containing such text and adds the JournalEntries specified
         in that text to those already existing.
         See docstring for JournalEntry.load.
-        A client of JournalEntry.load ; a batch controller?
+        A client of JournalEntry.iter_load ; a batch controller?
+        Entries are appended as they are parsed.
         """
-        for journal_entry in JournalEntry.load(text_or_filename): 
+        for journal_entry in JournalEntry.iter_load(text_or_filename,
+                        self.defaults.get('import_processes', 1)):
             self.append(journal_entry)
 
 
@@ -1406,9 +2537,7 @@ def adjust4assets(chart_of_accounts):
     """
     print("Begin running custom function adjust4assets")
     total_assets_2split = 0
-    asset_codes2check = [code for code in
-                                chart_of_accounts.ordered_codes
-                                        if (code[:2] == '15') ]
+    asset_codes2check = chart_of_accounts.codes_in_range(1500, 1599)
     asset_codes = []
     for asset_code in asset_codes2check:
         acnt = chart_of_accounts.accounts[asset_code]
@@ -1423,9 +2552,9 @@ def adjust4assets(chart_of_accounts):
                 'Adjust equity and liability accounts to reflect',
                 "ownership of assets by the 'group of 8'.",
                 ("2001,2002,2003,2004,2005,2006,2007,2008 Cr {}"
-                .format(total_assets_2split)),
+                .format(money.dollars(total_assets_2split))),
                 ("3001,3002,3003,3004,3005,3006,3007,3008 Dr {}"
-                .format(total_assets_2split)),
+                .format(money.dollars(total_assets_2split))),
                 '\n'  # ...to satisfy journal entry requirements.
                 ])
     print(
@@ -1456,7 +2585,7 @@ def zero_temporaries(chart_of_accounts):
                            # one line,) and zeroing entry: as a list
                            # of strings.
                 format_line, # format string used for balancing entries.
-                split_list): # returned by divider()
+                split_list): # returned by divide_cents()
         """                           [Not subjected to unittest.]
         Sets up text that can be read as a journal entry.
         Assumes that numerically sequential accounts are being
@@ -1465,7 +2594,8 @@ def zero_temporaries(chart_of_accounts):
         """
         ret = preamble
         for i in range(len(split_list)):
-            ret.append(format_line.format(i + 1, split_list[i]))
+            ret.append(format_line.format(i + 1,
+                                    money.dollars(split_list[i])))
         ret.append('\n')  # Journal entry depends on this trailing CR
         return '\n'.join(ret)
 
@@ -1475,54 +2605,55 @@ def zero_temporaries(chart_of_accounts):
     income = {}
     for code in chart_of_accounts.ordered_codes:
         acnt = chart_of_accounts.accounts[code]
-        if (code[:1] == '5') and (not
+        category = acnt.category
+        if (category == 'EXPENSE') and (not
                     acnt.place_holder):
         # if expense account that isn't a place holder:
             _value = expenses.setdefault(
                         acnt.split, 0)
             expenses[acnt.split] += acnt.signed_balance
     # expenses[9]: Cr 5001  Dr 3001..3009
-        if (code[:1] == '4') and (not
+        if (category == 'INCOME') and (not
                     acnt.place_holder):
         # if income account that isn't a place holder:
             _value = income.setdefault(
                         acnt.split, 0)
             income[acnt.split] += acnt.signed_balance
-#           print('Adding ${:.2f} (in Acnt:{}) to income totals.'
-#                       .format(acnt.signed_balance,
+#           print('Adding ${} (in Acnt:{}) to income totals.'
+#                       .format(money.dollars(acnt.signed_balance),
 #                       code))
     if expenses[9]:
         entries.append(zero_out(
             ['Sept 27, 2015', 'book keeper',
             'Distribute expenses among 9 participants.',
-            '5001 Cr {:.2f}'.format(expenses[9])],
-            '30{:0>2} Dr {:.2f}',
-            divider(expenses[9], 9)))
+            '5001 Cr {}'.format(money.dollars(expenses[9]))],
+            '30{:0>2} Dr {}',
+            divide_cents(expenses[9], 9)))
     # expenses[10]: Cr 5002  Dr  3001..3010
     if expenses[10]:
         entries.append(zero_out(
             ['Sept 27, 2015', 'book keeper',
             'Distribute expenses among 10 participants.',
-            '5002 Cr {:.2f}'.format(expenses[10])],
-            '30{:0>2} Dr {:.2f}',
-            divider(expenses[10], 10)))
+            '5002 Cr {}'.format(money.dollars(expenses[10]))],
+            '30{:0>2} Dr {}',
+            divide_cents(expenses[10], 10)))
 #   print("'income9' contains {:.2f}"
 #                   .format(income[9]))
     if income[9]:
         entries.append(zero_out(
             ['Sept 27, 2015', 'book keeper',
             'Distribute income among 9 participants.',
-            '4001 Dr {:.2f}'.format(income[9])],
-            '30{:0>2} Cr {:.2f}',
-            divider(income[9], 9)))
+            '4001 Dr {}'.format(money.dollars(income[9]))],
+            '30{:0>2} Cr {}',
+            divide_cents(income[9], 9)))
     # expenses[10]: Cr 5002  Dr  3001..3010
     if income[10]:
         entries.append(zero_out(
             ['Sept 27, 2015', 'book keeper',
             'Distribute income among 10 participants.',
-            '4002 Dr {:.2f}'.format(income[10])],
-            '30{:0>2} Cr {:.2f}',
-            divider(income[10], 10)))
+            '4002 Dr {}'.format(money.dollars(income[10]))],
+            '30{:0>2} Cr {}',
+            divide_cents(income[10], 10)))
     # Note: the following join method is used on the empty string
     # rather than a CR because a CR was added to each string in the
     # list by the zero_out method (because journal reading depends
@@ -1544,18 +2675,19 @@ def check_equity_vs_bank(chart_of_accounts):
     """
     print("Running custom function check_equity_vs_bank")
     assets = 0
-    codes2check = [ code for code in chart_of_accounts.ordered_codes
-            if (code[:2] == '30') ]  # Equity accounts
+    codes2check = chart_of_accounts.codes_in_range(
+                                    3000, 3099)  # Equity accounts
     for code in codes2check:
         acnt = chart_of_accounts.accounts[code]
         if not acnt.place_holder:
             assets += acnt.signed_balance
-    ret = ["Total assets of participants:  {:.2f}"
-                .format(assets)]
+    ret = ["Total assets of participants:  {}"
+                .format(money.dollars(assets))]
     ret.append(
         "...which balances nicely against the total liquid assets...")
-    ret.append("... remaining in bank account: {:.2f}"
-        .format(chart_of_accounts.accounts['1110'].signed_balance))
+    ret.append("... remaining in bank account: {}"
+        .format(money.dollars(
+            chart_of_accounts.accounts['1110'].signed_balance)))
     return '\n'.join(ret)
     print("Finished running custom function check_equity_vs_bank")
 
@@ -69,7 +69,7 @@ def create_entity(entity_name, defaults, set_default=True):
         1. <entity_name> already exists, or
         2. not able to write to new directory.
     Also sets up 
-    1. an empty journal file, and
+    1. an empty (JSON Lines) journal file, and
     2. a metadata file.
     The names of the above two files are defined in 
     src.config.defaults["metadata_name"] and
@@ -100,7 +100,7 @@ def create_entity(entity_name, defaults, set_default=True):
         os.mkdir(new_dir)
         shutil.copy(cofa_source, new_CofA_file_name)
         with open(new_Journal, 'w') as journal_file_object:
-            journal_file_object.write('{"Journal": []}')
+            pass  # An empty JSON Lines file: no entries yet.
         with open(meta_dest, 'w') as json_file:
             json_file.write(metadata)
 #       print("\tCreated and populated '{}'.".format(new_dir))
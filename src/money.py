@@ -37,6 +37,19 @@ def get_currency_value(string,
     Those expressions in turn depend on the currency symbol
     set in src.config.DEFAULT_CURRENCY_SYMBOL
     Returns a float if successful, None if not.
+    (See get_currency_cents for the exact, integer, version.)
+    """
+    cents = get_currency_cents(string, pat_w_symbol, debug)
+    if cents is not None:
+        return cents / 100
+
+def get_currency_cents(string,
+                    pat_w_symbol=pat_w_symbol,
+                    debug=False):
+    """
+    As get_currency_value but returns the value as an int
+    number of cents (no floating point is involved.)
+    Returns None if unsuccessful (or if the value is zero.)
     """
     value = cents = ''
     negative = False
@@ -62,20 +75,37 @@ def get_currency_value(string,
             if debug:
                 print("no dollar value. => '0'")
             value = "0"
-        value = float(value)
+        value = int(value)
         cents = res.group("c1")
         if debug: print("cents is {}".format(cents))
         if not cents:
             if debug: print("no cents. => '0'")
             cents = "0"
         if len(cents) == 1: cents += "0"
-        cents = float(cents)
+        cents = int(cents)
         if debug: print("final cents: {}".format(cents))
-        value += cents / 100
+        value = value * 100 + cents
         if negative: value = -value
         if value != 0:
             return value
 
+def to_cents(amount):
+    """
+    Converts amount (dollars: a float, an int or a string
+    representation of either) to an int number of cents.
+    Raises ValueError if amount can not be interpreted.
+    """
+    return int(round(float(amount) * 100))
+
+def dollars(cents):
+    """
+    Returns a string representation (to two decimal places and
+    without a currency symbol) of an int number of cents.
+    """
+    if cents < 0:
+        return '-' + dollars(-cents)
+    return "{}.{:02}".format(*divmod(cents, 100))
+
 data2test = (
     ("nothing here", "None"),
     ("-45", "None"),
@@ -12,7 +12,9 @@ and exit.
 """
 
 import os
+import sys
 from src import debk
+from src import money
 from src import config
 
 def setup_entity(defaults):
@@ -23,7 +25,9 @@ def setup_entity(defaults):
     """
     cofa = debk.ChartOfAccounts(defaults)
     journal = debk.Journal(defaults)
-    cofa.load_journal_entries(journal.journal)
+    cofa.journal = journal
+    brought_forward = cofa.load_checkpoint(journal)
+    cofa.load_journal_entries(journal.entries_after(brought_forward))
     return cofa, journal
 
 
@@ -36,12 +40,13 @@ def work_with(defaults):
                     .format(defaults["entity"]))
     menu(defaults, *setup_entity(defaults))
 
-def save_work(journal):
+def save_work(journal, cofa):
     error_string = journal.save()
     if error_string:
         print(error_string)
     else:
         print('Journal saved successfully.')
+    cofa.save_checkpoint(journal)
 
 def deal_w_new_entries(new_entries, cofa, journal):
     if new_entries:
@@ -68,18 +73,20 @@ def load2journal(cofa, journal):
             .format(file_name))
     if not os.path.isfile(file_name):
         return "Unable to find file '{}'".format(file_name)
-    new_entries = debk.JournalEntry.load(file_name)
-    if new_entries:
-        deal_w_new_entries(new_entries, cofa, journal)
+    # Entries are dealt with one at a time as they are read.
+    for new_entry in debk.JournalEntry.iter_load(file_name,
+                    journal.defaults.get('import_processes', 1)):
+        deal_w_new_entries([new_entry], cofa, journal)
 
 def show_journal(journal):
     file_name = input("Enter a file name (blank if to screen): ")
     if not file_name:
-        print(journal.show())
+        debk.write_joined(journal.iter_show(), sys.stdout)
+        print()
     else:
         try:
             with open(file_name, 'w') as file_obj:
-                file_obj.write(journal.show())
+                debk.write_joined(journal.iter_show(), file_obj)
         except IOError:
             print("Unable to write journal to file '{}'."
                 .format(file_name))
@@ -90,11 +97,12 @@ def show_journal(journal):
 def show_accounts(cofa):
     file_name = input("Enter a file name (blank if to screen): ")
     if not file_name:
-        print(cofa.show_accounts())
+        debk.write_joined(cofa.iter_show_accounts(), sys.stdout)
+        print()
     else:
         try:
             with open(file_name, 'w') as file_obj:
-                file_obj.write(cofa.show_accounts())
+                debk.write_joined(cofa.iter_show_accounts(), file_obj)
         except IOError:
             print("Unable to write cofa to file '{}'."
                 .format(file_name))
@@ -131,12 +139,13 @@ def close_fiscal_period(cofa, journal):
         closing_date = src.config.FISCAL_YEAR_END
     net_income = cofa.get_net_income()
     print("Net Income at closing is: ${}"
-            .format(net_income))
+            .format(money.dollars(net_income)))
     income_statement = cofa.show_balance_sheet(closing_date)
     closing_entry = JournalEntry( 0, date, user,
         [config.INCOME_TRANSFER2EQUITY_DESCRIPTOR],
-        [LineEntry(config.NET_INCOME_ACCOUNT, "Dr", net_income),
-         LineEntry(config.EQUITY4INCOME_ACCOUNT, "Cr", net_income)])
+        [LineEntry(config.NET_INCOME_ACCOUNT, "Dr", cents=net_income),
+         LineEntry(config.EQUITY4INCOME_ACCOUNT, "Cr",
+                                                cents=net_income)])
     journal.append(closing_entry)
     cofa.load_journal_entries([closing_entry])
     balance_sheet = cofa.show_income_statement(
@@ -177,7 +186,7 @@ Working with {}:
 Choice: """.format(defaults["entity"]))
         print("You've chosen: {}".format(option))
         if option in ('', '_', '0'):
-            ret = save_work(journal)
+            ret = save_work(journal, cofa)
             if ret:
                 print(ret)
             else: 
@@ -0,0 +1,348 @@
+#!./venv/bin/python3
+# -*- coding: utf-8 -*-
+# vim: set file encoding=utf-8 :
+#
+# file: 'tests/benchmark.py'
+# Part of debk, Double Entry Book Keeping module.
+
+# Copyright 2015 Alex Kleider
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#   Look for file named COPYING.
+"""
+Benchmarks for debk.src.debk.py.
+Not part of the test suite; run from the project root with:
+    python3 -m tests.benchmark
+"""
+import os
+import gc
+import json
+import shutil
+import datetime
+import contextlib
+import time
+import tempfile
+import tracemalloc
+
+import src.debk as debk
+import src.date as date
+from src.config import DEFAULTS as D
+
+TEST_HOME = os.path.join(os.path.dirname(__file__), 'debk.d')
+N_ENTRIES = 20000
+N_LOAD_ENTRIES = 100000
+N_INPUT_ENTRIES = 20000
+
+INPUT_ENTRY = """Jul 03, 2015
+book keeper
+Pay for some food.
+5310 Dr 304.20
+3001,3002,3003,3004 Dr 2100.50
+1010 Cr 2404.70
+
+"""
+
+
+def make_entries(n=N_ENTRIES, per_day=None):
+    """
+    Returns a list of <n> two line journal entries: all dated
+    Jul 03, 2015 or, if per_day is given, that many to a day from
+    then on.
+    """
+    first = datetime.date(2015, 7, 3)
+    if per_day:
+        stamps = [date.string_from_date_object(
+                        first + datetime.timedelta(i // per_day))
+                    for i in range(n)]
+    else:
+        stamps = [date.string_from_date_object(first)] * n
+    return [debk.JournalEntry(n, stamp, "book keeper",
+                              "Pay for some food.",
+                              [debk.LineEntry('5300', 'D', cents=30420),
+                               debk.LineEntry('1010', 'C', cents=30420)])
+            for n, stamp in zip(range(1, n + 1), stamps)]
+
+
+@contextlib.contextmanager
+def saved_journal(entries):
+    """
+    A context manager: saves entries as the journal of an entity
+    (in a temporary 'home' directory, along with the default chart
+    of accounts) and provides the defaults with which to load it.
+    """
+    saved_home = D['home']
+    with tempfile.TemporaryDirectory() as home:
+        D['home'] = home
+        try:
+            entity_dir = os.path.join(home, 'benchmark.d')
+            os.mkdir(entity_dir)
+            shutil.copy(os.path.join(TEST_HOME, D['cofa_template']),
+                        os.path.join(entity_dir, D['cofa_name']))
+            with open(os.path.join(entity_dir, D['journal_name']),
+                                                        'w') as f:
+                for entry in entries:
+                    f.write(json.dumps(entry._dict) + '\n')
+            with open(os.path.join(entity_dir, D['metadata_name']),
+                                                        'w') as f:
+                json.dump(dict(entity_name='benchmark',
+                        next_journal_entry_number=len(entries) + 1,
+                        last_closing='unset'), f)
+            yield dict(D, entity='benchmark')
+        finally:
+            D['home'] = saved_home
+
+
+def bytes_per_posting(n=N_ENTRIES):
+    """
+    Returns a (journal, ledger, columnar) tuple: the memory, in
+    bytes, used per posting (line entry) by the journal, by the
+    ledger and by the ledger if its postings are kept in arrays
+    (debk.PostingColumns.)
+    """
+    gc.collect()
+    tracemalloc.start()
+    entries = make_entries(n)
+    journal_size = tracemalloc.get_traced_memory()[0]
+    items = [debk.LineItem(entry.entry_number, line.type_,
+                           cents=line.cents)
+             for entry in entries
+             for line in entry.line_entries]
+    ledger_size = tracemalloc.get_traced_memory()[0] - journal_size
+    columns = debk.PostingColumns()
+    for item in items:
+        columns.append(item)
+    columnar_size = (tracemalloc.get_traced_memory()[0]
+                    - journal_size - ledger_size)
+    tracemalloc.stop()
+    n_postings = len(items)
+    return (journal_size / n_postings, ledger_size / n_postings,
+            columnar_size / n_postings)
+
+
+def journal_load_seconds(n=N_LOAD_ENTRIES, lazy=False):
+    """
+    Writes a journal of <n> entries (in a temporary 'home'
+    directory) and returns the time, in seconds, that it takes
+    debk.Journal to load it (or, if lazy, to index it.)
+    """
+    with saved_journal(make_entries(n)) as defaults:
+        start = time.perf_counter()
+        journal = debk.Journal(dict(defaults, lazy_journal=lazy))
+        seconds = time.perf_counter() - start
+    assert len(journal) == n
+    return seconds
+
+
+def period_query_seconds(n=N_LOAD_ENTRIES, per_day=50):
+    """
+    Over a journal of <n> entries, <per_day> to a day, returns a
+    (build, indexed, scanned) tuple of times in seconds: to build
+    the journal's date_index, and to find the entries of a 31 day
+    period with it and by scanning the whole journal.
+    """
+    with saved_journal(make_entries(n, per_day)) as defaults:
+        journal = debk.Journal(defaults)
+        start = time.perf_counter()
+        journal.date_index
+        build = time.perf_counter() - start
+        first = journal[n // 2].ordinal
+        last = first + 30
+        start = time.perf_counter()
+        indexed = list(journal.entries_in_period(
+                                datetime.date.fromordinal(first),
+                                datetime.date.fromordinal(last)))
+        indexed_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        scanned = [entry for entry in journal
+                    if first <= entry.ordinal <= last]
+        scanned_seconds = time.perf_counter() - start
+    assert len(indexed) == len(scanned) == 31 * per_day
+    return build, indexed_seconds, scanned_seconds
+
+
+def balance_as_of_seconds(n=N_LOAD_ENTRIES, per_day=50,
+                            n_queries=1000):
+    """
+    Over a journal of <n> entries, <per_day> to a day, returns a
+    (build, query, backdated, replay) tuple of times in seconds: to
+    build the journal's balance_index, to answer an as of date
+    balance query with it and to append a back dated entry (each
+    an average of <n_queries>) and to get the same balance by
+    loading a ledger with the entries up to that date.
+    """
+    with saved_journal(make_entries(n, per_day)) as defaults:
+        journal = debk.Journal(defaults)
+        start = time.perf_counter()
+        journal.balance_index
+        build = time.perf_counter() - start
+        first = journal[1].ordinal
+        as_of = [datetime.date.fromordinal(first + i % (n // per_day))
+                    for i in range(n_queries)]
+        start = time.perf_counter()
+        for day in as_of:
+            journal.balance_as_of('5300', day)
+        query = (time.perf_counter() - start) / n_queries
+        start = time.perf_counter()
+        for entry in make_entries(n_queries):  # All on the first day.
+            journal.append(entry)
+        backdated = (time.perf_counter() - start) / n_queries
+        start = time.perf_counter()
+        cofa = debk.ChartOfAccounts(defaults)
+        cofa.load_journal_entries(journal.entries_in_period(
+                                journal[1].date_stamp, as_of[-1]))
+        replay = time.perf_counter() - start
+    assert cofa.accounts['5300'].net == journal.balance_as_of(
+                                                    '5300', as_of[-1])
+    return build, query, backdated, replay
+
+
+def journal_show_seconds(n=N_LOAD_ENTRIES):
+    """
+    Returns a (show, rebuilt) tuple: the time, in seconds, for
+    Journal.show over <n> entries and for doing the same with each
+    line entry rebuilt from its _dict (as JournalEntry.show used
+    to) before being shown.
+    """
+    with saved_journal(make_entries(n)) as defaults:
+        journal = debk.Journal(defaults)
+        start = time.perf_counter()
+        shown = journal.show()
+        show = time.perf_counter() - start
+        start = time.perf_counter()
+        rebuilt = [next(journal.iter_show())]  # The heading.
+        for je in journal:
+            rebuilt.append('\n'.join(
+                ["  #{entry_number:0>3} on {date_stamp:<12} by {user}."
+                    .format(**je._dict)]
+                + ["    {}".format(line)
+                    for line in je.description.split('\n')]
+                + [debk.LineEntry(**line_entry).show()
+                    for line_entry in je._dict["line_entries"]]))
+        rebuilt_seconds = time.perf_counter() - start
+    assert shown == '\n'.join(rebuilt)
+    return show, rebuilt_seconds
+
+
+def input_lines_per_second(n=N_INPUT_ENTRIES):
+    """
+    Returns a (load, scanned, searched) tuple of rates, in lines
+    per second: JournalEntry.load over <n> entries of bulk input
+    text and LineEntry.list_from_text over their line entry lines,
+    both with scan_line_entry and with the separate searches it
+    replaces.
+    """
+    text = INPUT_ENTRY * n
+    n_lines = text.count('\n')
+    start = time.perf_counter()
+    assert len(debk.JournalEntry.load(text)) == n
+    load = n_lines / (time.perf_counter() - start)
+    lines = [line for line in text.split('\n')
+                if line[:1].isdigit()]
+    rates = []
+    for scanned in (None, False):
+        start = time.perf_counter()
+        for line in lines:
+            debk.LineEntry.list_from_text(line, scanned)
+        rates.append(len(lines) / (time.perf_counter() - start))
+    return (load, rates[0], rates[1])
+
+
+def date_checks_per_second(n=100000):
+    """
+    Returns a (parse_date, quick_check_date, check_date) tuple of
+    calls per second over <n> date entries (365 different ones.)
+    """
+    first = datetime.date(2015, 1, 1)
+    entries = ["{:%B} {}, {}".format(day, day.day, day.year)
+                for day in (first + datetime.timedelta(i % 365)
+                            for i in range(n))]
+    rates = []
+    date.check_date.cache_clear()
+    for function in (date.parse_date, date.quick_check_date,
+                    date.check_date):
+        start = time.perf_counter()
+        for entry in entries:
+            function(entry)
+        rates.append(n / (time.perf_counter() - start))
+    return tuple(rates)
+
+
+def import_seconds(processes, n=5 * N_INPUT_ENTRIES):
+    """
+    Returns the time, in seconds, to parse a file of <n> bulk input
+    entries using JournalEntry.iter_load with <processes> processes.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, 'input')
+        with open(file_name, 'w') as f_object:
+            f_object.write(INPUT_ENTRY * n)
+        start = time.perf_counter()
+        count = 0
+        for entry in debk.JournalEntry.iter_load(file_name, processes):
+            count += 1
+        seconds = time.perf_counter() - start
+    assert count == n
+    return seconds
+
+
+def main():
+    journal, ledger, columnar = bytes_per_posting()
+    print("Memory per posting ({} postings):".format(2 * N_ENTRIES))
+    print("    journal: {:7.1f} bytes".format(journal))
+    print("    ledger:  {:7.1f} bytes".format(ledger))
+    print("    ledger (columnar): {:7.1f} bytes".format(columnar))
+    for lazy in (False, True):
+        seconds = journal_load_seconds(lazy=lazy)
+        print("Journal {} ({} entries): {:.2f} seconds ({:.1f} us/entry)"
+                .format(("load", "index (lazy)")[lazy],
+                        N_LOAD_ENTRIES, seconds,
+                        seconds * 1e6 / N_LOAD_ENTRIES))
+    build, indexed, scanned = period_query_seconds()
+    print("Entries of a 31 day period of {} entries:"
+                .format(N_LOAD_ENTRIES))
+    print("    building the date index: {:.4f} seconds".format(build))
+    print("    with the date index: {:.4f} seconds".format(indexed))
+    print("    scanning the journal: {:.4f} seconds".format(scanned))
+    build, query, backdated, replay = balance_as_of_seconds()
+    print("Balance as of a date ({} entries):".format(N_LOAD_ENTRIES))
+    print("    building the balance index: {:.4f} seconds"
+                .format(build))
+    print("    query with the balance index: {:.6f} seconds"
+                .format(query))
+    print("    appending a back dated entry: {:.6f} seconds"
+                .format(backdated))
+    print("    loading a ledger to that date: {:.4f} seconds"
+                .format(replay))
+    show, rebuilt = journal_show_seconds()
+    print("Journal.show ({} entries):".format(N_LOAD_ENTRIES))
+    print("    from the entries: {:.2f} seconds".format(show))
+    print("    rebuilding line entries: {:.2f} seconds"
+                .format(rebuilt))
+    load, scanned, searched = input_lines_per_second()
+    print("Bulk input, lines per second:")
+    print("    JournalEntry.load: {:9.0f}".format(load))
+    print("    list_from_text (single scan): {:9.0f}".format(scanned))
+    print("    list_from_text (three searches): {:9.0f}"
+                .format(searched))
+    print("Date checks per second:")
+    for name, rate in zip(("parse_date", "quick_check_date",
+                "check_date (memoized)"), date_checks_per_second()):
+        print("    {}: {:9.0f}".format(name, rate))
+    print("Import of {} entries:".format(5 * N_INPUT_ENTRIES))
+    for processes in (1, 2, 4):
+        print("    {} process(es): {:.2f} seconds"
+                .format(processes, import_seconds(processes)))
+
+
+if __name__ == '__main__':
+    main()
@@ -23,6 +23,7 @@
 """
 test suite for debk.src.date.check_date.
 """
+import datetime
 import unittest
 import src.money as money
 import src.date as date
@@ -87,5 +88,25 @@ class DateStamp(unittest.TestCase):
                 self.assertEqual(date.check_date(input_string),
                                     result)
 
+    def test_quick_check_date(self):
+        for input_string in ("Jul 3, 2015", "july 03, 15", "Feb 29, 2016",
+                "Feb 29, 2015", "Sept 31, 0015", "7 3 2015", "07/03/15",
+                "13-1-2015", "0 1 2015", "Foo 3, 2015"):
+            with self.subTest(input_string=input_string):
+                try:
+                    quick = date.quick_check_date(input_string)
+                except ValueError:
+                    self.assertEqual(input_string, "Foo 3, 2015")
+                else:
+                    self.assertEqual(quick,
+                                    date.parse_date(input_string))
+
+    def test_date_object_from_entry(self):
+        self.assertEqual(date.date_object_from_entry("Feb 28, 2013"),
+                        datetime.date(2013, 2, 28))
+        self.assertIsNone(date.date_object_from_entry("Feb 29, 2013"))
+        self.assertEqual(date.date_object_from_entry("feb 28, 2013"),
+                        datetime.date(2013, 2, 28))  # via strptime
+
 if __name__ == '__main__':  # code block to run the application
     unittest.main()
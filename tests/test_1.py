@@ -25,7 +25,10 @@ First test suite for debk.src.debk.py.
 import os
 import sys
 import csv
+import io
 import json
+import datetime
+import contextlib
 import shutil
 import unittest
 import src.entities as E
@@ -144,6 +147,104 @@ class divider(unittest.TestCase):
         with self.assertRaises(ZeroDivisionError):
             debk.divider(-10, 0)
 
+class DivideCents(unittest.TestCase):
+    """test the global divide_cents() function"""
+
+    def test1000by3(self):
+        self.assertEqual(debk.divide_cents(1000, 3), [334, 333, 333])
+
+    def test_minus1000by3(self):
+        self.assertEqual(debk.divide_cents(-1000, 3),
+                        [-333, -333, -334])
+
+class Cents(unittest.TestCase):
+    """Money is kept as an int number of cents."""
+
+    def test_line_entry_cents(self):
+        line_entries = debk.LineEntry.list_from_text(
+                                        "1010,1011,1012 Cr 4.51")
+        self.assertEqual([line_entry.cents
+                for line_entry in line_entries], [151, 150, 150])
+
+    def test_balanced_exactly(self):
+        dimes = [debk.LineEntry('1010', 'D', 0.10)] * 3
+        self.assertTrue(debk.LineEntry.balanced_LineEntry_list(
+                    dimes + [debk.LineEntry('3100', 'C', 0.30)]))
+        self.assertFalse(debk.LineEntry.balanced_LineEntry_list(
+                    dimes + [debk.LineEntry('3100', 'C', 0.31)]))
+
+class ScanLineEntry(unittest.TestCase):
+    """scan_line_entry must agree with the three separate searches."""
+
+    usual = ("5310 Dr 304.20", "Cr 3001,3002,3003 2100.50",
+            "3100 5000.00Cr", "3100 5000.Cr", "1010 -45.2 Dr",
+            "1010 Dr 45.33.")
+    unusual = ("Pay for some food.", "Dr 5000.00 1111",
+            "1111 Dr $5000.00", "3100 5000Cr", "1010 Dr Cr 4.50",
+            "1010 Dr 4.50 by cheque")
+
+    def test_usual(self):
+        for line in self.usual[:-1]:
+            with self.subTest(line=line):
+                self.assertEqual(debk.scan_line_entry(line),
+                    (debk.money.get_currency_cents(line),
+                    debk.config.get_list_of_accounts(line),
+                    debk.drcr.drcr(line)))
+
+    def test_unusual(self):
+        for line in self.usual[-1:] + self.unusual:
+            with self.subTest(line=line):
+                self.assertIsNone(debk.scan_line_entry(line))
+
+class StreamedInput(unittest.TestCase):
+    """Input files are read a line at a time."""
+
+    file_name = './tests/debk.d/streamed_input'
+
+    def test_input_lines(self):
+        for text in ('', '\n', 'a', 'a\n', 'a\n\nb', 'a\nb\n\n'):
+            with open(self.file_name, 'w') as f_object:
+                f_object.write(text)
+            with self.subTest(text=text):
+                self.assertEqual(
+                    list(debk.input_lines(self.file_name)),
+                    text.split('\n'))
+
+    def test_iter_load(self):
+        source = os.path.join(D['home'], 'Manero_input0')
+        entries = debk.JournalEntry.iter_load(source)
+        self.assertEqual(next(entries).show(),
+                        debk.JournalEntry.load(source)[0].show())
+        self.assertEqual(
+            [je.show() for je in debk.JournalEntry.iter_load(source)],
+            [je.show() for je in debk.JournalEntry.load(source)])
+
+    def test_parallel(self):
+        source = os.path.join(D['home'], 'Manero_input0')
+        with open(source, 'r') as f_object:
+            text = f_object.read()
+        with open(self.file_name, 'w') as f_object:
+            f_object.write(text + "\n\nJul 1, 2015\nme\nUnbalanced\n"
+                        + "1010 Dr 1.00\n3100 Cr 2.00\n\n" + text)
+        results = []
+        for parallel in (False, True):
+            printed = io.StringIO()
+            with contextlib.redirect_stdout(printed):
+                if parallel:
+                    entries = list(debk.iter_load_parallel(
+                                self.file_name, 2, chunk_lines=20))
+                else:
+                    entries = list(debk.JournalEntry.iter_load(
+                                                    self.file_name))
+            results.append(([je.show() for je in entries],
+                            printed.getvalue()))
+        self.assertEqual(results[0], results[1])
+        self.assertIn("Unbalanced", results[0][1])  # Rejected.
+
+    def tearDown(self):
+        if os.path.isfile(self.file_name):
+            os.remove(self.file_name)
+
 class ValidAccountType(unittest.TestCase):
     """Test global function valid_account_type(_type)."""
     def test_valid_account_types(self):
@@ -240,10 +341,10 @@ class CreateEntity(unittest.TestCase):
         Tests that an empty journal has been created.
         """
         for entity_dir in self.entity_dirs.values():
-            with open(os.path.join(entity_dir, 'Journal.json'),
+            with open(os.path.join(entity_dir, 'Journal.jsonl'),
                     'r') as journal_file_obj:
                 self.assertTrue(
-                    journal_file_obj.read() == '{"Journal": []}') 
+                    journal_file_obj.read() == '') 
 
     def test_MetadataFileCreation(self):
         """
@@ -385,39 +486,31 @@ class Account_signed_balance(unittest.TestCase):
         acnt1n.balance = -2.5; acnt1n.type_ = 'D'
         testdata.append((acnt1n.signed_balance, -2.5))
         
-        acnt2p = debk.Account(acnt_dict)
-        acnt2p.code = '2110'
+        acnt2p = debk.Account(dict(acnt_dict, code= '2110'))
         acnt2p.balance = 2.5; acnt2p.type_ = 'C'
         testdata.append((acnt2p.signed_balance, 2.5))
-        acnt2n = debk.Account(acnt_dict)
-        acnt2n.code = '2110'
+        acnt2n = debk.Account(dict(acnt_dict, code= '2110'))
         acnt2n.balance = -2.5; acnt2n.type_ = 'C'
         testdata.append((acnt2n.signed_balance, -2.5))
         
-        acnt3p = debk.Account(acnt_dict)
-        acnt3p.code = '3110'
+        acnt3p = debk.Account(dict(acnt_dict, code= '3110'))
         acnt3p.balance = 2.5; acnt3p.type_ = 'C'
         testdata.append((acnt3p.signed_balance, 2.5))
-        acnt3n = debk.Account(acnt_dict)
-        acnt3n.code = '3110'
+        acnt3n = debk.Account(dict(acnt_dict, code= '3110'))
         acnt3n.balance = -2.5; acnt3n.type_ = 'C'
         testdata.append((acnt3n.signed_balance, -2.5))
         
-        acnt4p = debk.Account(acnt_dict)
-        acnt4p.code = '4110'
+        acnt4p = debk.Account(dict(acnt_dict, code= '4110'))
         acnt4p.balance = 2.5; acnt4p.type_ = 'C'
         testdata.append((acnt4p.signed_balance, 2.5))
-        acnt4n = debk.Account(acnt_dict)
-        acnt4n.code = '4110'
+        acnt4n = debk.Account(dict(acnt_dict, code= '4110'))
         acnt4n.balance = -2.5; acnt4n.type_ = 'C'
         testdata.append((acnt4n.signed_balance, -2.5))
         
-        acnt5p = debk.Account(acnt_dict)
-        acnt5p.code = '5110'
+        acnt5p = debk.Account(dict(acnt_dict, code= '5110'))
         acnt5p.balance = 2.5; acnt5p.type_ = 'D'
         testdata.append((acnt5p.signed_balance, 2.5))
-        acnt5n = debk.Account(acnt_dict)
-        acnt5n.code = '5110'
+        acnt5n = debk.Account(dict(acnt_dict, code= '5110'))
         acnt5n.balance = -2.5; acnt5n.type_ = 'D'
         testdata.append((acnt5n.signed_balance, -2.5))
 
@@ -484,6 +577,146 @@ JOURNAL ENTRIES:......           Entity: 'testentity'
 #       print("report is:\n{}".format(report))
         self.assertEqual(report, expected)
 
+    def test_save_appends(self):
+        journal = debk.Journal(D)
+        journal.load(self.entries)
+        journal.save()
+        journal.load(self.entries)
+        journal.save()
+        with open(journal.journal_file, 'r') as f_object:
+            lines = f_object.readlines()
+        self.assertEqual(len(lines), 2)
+        reloaded = debk.Journal(D)
+        self.assertEqual(
+            [je.entry_number for je in reloaded.journal], [1, 2])
+        self.assertEqual(reloaded.next_entry, 3)
+        self.assertEqual(reloaded.show(), journal.show())
+
+    def test_legacy_conversion(self):
+        journal = debk.Journal(D)
+        journal.load(self.entries)
+        legacy = {"Journal": [je._dict for je in journal.journal]}
+        entity_dir = os.path.dirname(journal.journal_file)
+        os.remove(journal.journal_file)
+        with open(os.path.join(entity_dir,
+                    D['legacy_journal_name']), 'w') as f_object:
+            json.dump(legacy, f_object)
+        converted = debk.Journal(D)
+        self.assertEqual(converted.show(), journal.show())
+
+    def test_recovery(self):
+        journal = debk.Journal(D)
+        journal.load(self.entries)
+        journal.load(self.entries)
+        journal.save()
+        metadata = dict(journal.metadata)
+        journal.load(self.entries)
+        journal.save()
+        # Simulate a crash: metadata not yet replaced and the
+        # next save interrupted part way through its one line.
+        with open(journal.metadata_file, 'w') as f_object:
+            json.dump(metadata, f_object)
+        with open(journal.journal_file, 'a') as f_object:
+            f_object.write('{"entry_number": 4, "date_st')
+        recovered = debk.Journal(D)
+        self.assertEqual(
+            [je.entry_number for je in recovered.journal], [1, 2, 3])
+        self.assertEqual(recovered.next_entry, 4)
+        with open(recovered.metadata_file, 'r') as f_object:
+            self.assertEqual(
+                json.load(f_object)['next_journal_entry_number'], 4)
+
+    def test_recovery_read_only(self):
+        journal = debk.Journal(D)
+        journal.load(self.entries)
+        journal.save()
+        with open(journal.metadata_file, 'w') as f_object:
+            json.dump(dict(journal.metadata,
+                        next_journal_entry_number=1), f_object)
+        atomic_write = debk.atomic_write
+        def failing_write(file_name, text):
+            raise PermissionError("Simulated read only directory.")
+        debk.atomic_write = failing_write
+        try:
+            with self.assertLogs(level='WARNING'):
+                reopened = debk.Journal(D)
+        finally:
+            debk.atomic_write = atomic_write
+        self.assertEqual(reopened.next_entry, 2)
+        self.assertTrue(reopened.changed)
+
+    def test_metadata_write_fails(self):
+        journal = debk.Journal(D)
+        journal.load(self.entries)
+        atomic_write = debk.atomic_write
+        def failing_write(file_name, text):
+            debk.atomic_write = atomic_write  # Fails only once.
+            raise IOError("Simulated failure.")
+        debk.atomic_write = failing_write
+        try:
+            self.assertIn("NOT saved", journal.save())
+        finally:
+            debk.atomic_write = atomic_write
+        self.assertIsNone(journal.save())  # Metadata only.
+        reloaded = debk.Journal(D)
+        self.assertEqual(
+            [je.entry_number for je in reloaded], [1])
+        self.assertEqual(reloaded.next_entry, 2)
+
+    def test_lazy(self):
+        journal = debk.Journal(D)
+        for _ in range(3):
+            journal.load(self.entries)
+        journal.save()
+        lazy = debk.Journal(dict(D, lazy_journal=True))
+        self.assertEqual(lazy.journal, [])
+        self.assertEqual(sorted(lazy.index), [1, 2, 3])
+        self.assertEqual(len(lazy), 3)
+        self.assertEqual(lazy[2].show(), journal[2].show())
+        self.assertRaises(KeyError, lazy.__getitem__, 4)
+        self.assertEqual(
+            [je.entry_number for je in lazy.entries_after(1)], [2, 3])
+        lazy.load(self.entries)
+        self.assertEqual(len(lazy), 4)
+        self.assertEqual(lazy.last_entry_number, 4)
+        lazy.save()
+        self.assertEqual(lazy.journal, [])
+        self.assertEqual(lazy[4].entry_number, 4)
+        journal.load(self.entries)
+        self.assertEqual(lazy.show(), journal.show())
+        self.assertEqual(debk.Journal(D).show(), journal.show())
+
+    def test_ordinal(self):
+        journal = debk.Journal(D)
+        journal.load(self.entries)
+        journal.load(self.entries.replace("July 3", "Aug 1"))
+        self.assertEqual(journal[1].ordinal,
+                        datetime.date(2015, 7, 3).toordinal())
+        journal.save()
+        with open(journal.journal_file, 'r') as f_object:
+            saved = json.loads(f_object.readline())
+        self.assertEqual(saved['ordinal'], journal[1].ordinal)
+        reloaded = debk.Journal(D)
+        self.assertEqual(
+            [je.ordinal for je in reloaded],
+            [datetime.date(2015, 7, 3).toordinal(),
+            datetime.date(2015, 8, 1).toordinal()])
+        self.assertEqual([je.entry_number for je in
+            reloaded.entries_in_period("Jul 4, 2015", "Dec 31, 2015")],
+            [2])
+        self.assertEqual([je.entry_number for je in
+            reloaded.entries_in_period(datetime.date(2015, 7, 3),
+                                        "Aug 1, 2015")],
+            [1, 2])
+
+    entries = """July 3, 2015
+Alex Kleider
+Pay for some food.
+5310 Dr 304.20
+3009 Cr 304.20
+
+"""
+
     def tearDown(self):
         try:
             shutil.rmtree('./tests/debk.d/testentity.d')
@@ -491,6 +724,327 @@ JOURNAL ENTRIES:......           Entity: 'testentity'
             print(
         "'./tests/debk.d/testentity.d' doesn't exist; can't delete.")
 
+class Checkpoint(unittest.TestCase):
+    """Test ChartOfAccounts save_checkpoint and load_checkpoint."""
+
+    entries = """July 3, 2015
+book keeper
+Start the business.
+1010 Dr 5000.00
+3100 Cr 5000.00
+
+July 4, 2015
+book keeper
+Buy supplies.
+5300 Dr 304.20
+1010 Cr 304.20
+
+"""
+
+    def setUp(self):
+        if os.path.isdir('./tests/debk.d/testentity.d'):
+            shutil.rmtree('./tests/debk.d/testentity.d')
+        E.create_entity("testentity", D)
+        journal = debk.Journal(D)
+        journal.load(self.entries)
+        journal.save()
+        cofa = debk.ChartOfAccounts(D)
+        cofa.load_journal_entries(journal.journal)
+        self.assertTrue(cofa.save_checkpoint(journal))
+        journal.load(self.entries)
+        journal.save()
+        self.journal = debk.Journal(D)
+
+    def full_replay(self):
+        cofa = debk.ChartOfAccounts(D)
+        cofa.load_journal_entries(self.journal.journal)
+        return cofa
+
+    def from_checkpoint(self):
+        cofa = debk.ChartOfAccounts(D)
+        brought_forward = cofa.load_checkpoint(self.journal)
+        cofa.load_journal_entries([je for je in self.journal.journal
+                                if je.entry_number > brought_forward])
+        return cofa, brought_forward
+
+    def test_balances_match(self):
+        expected = self.full_replay()
+        cofa, brought_forward = self.from_checkpoint()
+        self.assertEqual(brought_forward, 2)
+        self.assertEqual(len(cofa.accounts['1010'].line_items), 2)
+        for code in cofa.ordered_codes:
+            with self.subTest(code=code):
+                self.assertEqual(
+                    "{:.2f}".format(cofa.accounts[code].signed_balance),
+                    "{:.2f}".format(
+                            expected.accounts[code].signed_balance))
+
+    def test_same_report(self):
+        expected = self.full_replay()
+        cofa, brought_forward = self.from_checkpoint()
+        self.assertEqual(cofa.show_accounts(), expected.show_accounts())
+        self.assertEqual(len(cofa.accounts['1010'].line_items), 4)
+        columnar = debk.ChartOfAccounts(dict(D, columnar=True))
+        brought_forward = columnar.load_checkpoint(self.journal)
+        columnar.load_journal_entries(
+                        self.journal.entries_after(brought_forward))
+        self.assertEqual(columnar.show_accounts(),
+                        expected.show_accounts())
+
+    def test_earlier_entry_changed(self):
+        with open(self.journal.journal_file, 'r') as f_object:
+            text = f_object.read()
+        with open(self.journal.journal_file, 'w') as f_object:
+            f_object.write(text.replace('500000', '400000', 1))
+        self.journal = debk.Journal(D)
+        cofa, brought_forward = self.from_checkpoint()
+        self.assertEqual(brought_forward, 0)
+        self.assertEqual(len(cofa.accounts['1010'].line_items), 4)
+
+    def tearDown(self):
+        shutil.rmtree('./tests/debk.d/testentity.d')
+
+class AccountTree(unittest.TestCase):
+    """Test the place_holder (header) account tree."""
+
+    def setUp(self):
+        if os.path.isdir('./tests/debk.d/testentity.d'):
+            shutil.rmtree('./tests/debk.d/testentity.d')
+        E.create_entity("testentity", D)
+        self.cofa = debk.ChartOfAccounts(D)
+
+    def test_tree(self):
+        self.assertEqual(self.cofa.accounts['1010'].parent, '1000')
+        self.assertIsNone(self.cofa.accounts['1000'].parent)
+        self.assertEqual(self.cofa.accounts['3000'].children,
+                        ['3100', '3150'])
+
+    def test_fragments(self):
+        entries = debk.JournalEntry.load(Checkpoint.entries)
+        self.cofa.load_journal_entries(entries[:1])
+        self.cofa.show_accounts()
+        shown = {code: self.cofa.accounts[code].show_account(2)
+                for code in ('1000', '1010', '3100', '5000', '5300')}
+        self.cofa.load_journal_entries(entries[1:])  # 5300 & 1010
+        for code in ('1000', '1010', '5000', '5300'):
+            self.assertTrue(self.cofa.accounts[code].dirty)
+        self.assertFalse(self.cofa.accounts['3100'].dirty)
+        self.assertIs(self.cofa.accounts['3100'].show_account(2),
+                    shown['3100'])
+        self.assertIn('304.20',
+                    self.cofa.accounts['5300'].show_account(2))
+        fresh = debk.ChartOfAccounts(D)
+        fresh.load_journal_entries(entries)
+        self.assertEqual(self.cofa.show_accounts(),
+                        fresh.show_accounts())
+
+    def test_normal_type(self):
+        for code, normal_type in (('1010', 'D'), ('3100', 'C'),
+                                ('5300', 'D')):
+            with self.subTest(code=code):
+                self.assertEqual(self.cofa.accounts[code].normal_type,
+                                normal_type)
+
+    def test_subtotals(self):
+        self.cofa.load_journal_entries(
+                        debk.JournalEntry.load(Checkpoint.entries))
+        incremental = {code: self.cofa.accounts[code].s_balance
+                    for code in self.cofa.ordered_codes}
+        self.cofa._set_place_holder_signed_balances()
+        for code in self.cofa.ordered_codes:
+            with self.subTest(code=code):
+                self.assertEqual(incremental[code],
+                                self.cofa.accounts[code].s_balance)
+        self.assertEqual(self.cofa.accounts['1000'].s_balance, 469580)
+
+    def test_incremental_posting(self):
+        for entry in debk.JournalEntry.load(Checkpoint.entries):
+            self.cofa.load_journal_entries([entry])
+        self.assertEqual(self.cofa.trial_balance,
+                        dict(D= 530420, C= 530420))
+        for code in self.cofa.ordered_codes:
+            account = self.cofa.accounts[code]
+            posted = (account.balance, account.type_)
+            account.update_balance()
+            with self.subTest(code=code):
+                self.assertEqual(posted,
+                                (account.balance, account.type_))
+
+    def tearDown(self):
+        shutil.rmtree('./tests/debk.d/testentity.d')
+
+class Periods(unittest.TestCase):
+    """Test the journal's DateIndex and period bounded reports."""
+
+    def setUp(self):
+        if os.path.isdir('./tests/debk.d/testentity.d'):
+            shutil.rmtree('./tests/debk.d/testentity.d')
+        E.create_entity("testentity", D)
+        self.journal = debk.Journal(D)
+        self.journal.load(Checkpoint.entries)  # July 3 & 4, 2015
+        self.journal.save()
+        self.journal.load(Checkpoint.entries.replace('July', 'Aug'))
+        self.journal.load(Checkpoint.entries.replace('July 4', 'June 1'))
+
+    def test_date_index(self):
+        july = datetime.date(2015, 7, 1).toordinal()
+        self.assertEqual(self.journal.date_index.entry_numbers_in(
+                                        july, july + 30), [1, 2, 5])
+        lazy = debk.Journal(dict(D, lazy_journal=True))
+        self.assertEqual(lazy.date_index.entry_numbers_in(
+                                        july, july + 30), [1, 2])
+        lazy.extend(debk.JournalEntry.load(Checkpoint.entries))
+        self.assertEqual(lazy.date_index.entry_numbers_in(
+                                        july, july + 30), [1, 2, 3, 4])
+
+    def test_entries_in_period(self):
+        self.assertEqual([je.entry_number for je in
+                self.journal.entries_in_period("Jun 1, 2015",
+                                                "Jul 3, 2015")],
+                [1, 5, 6])
+        with self.assertLogs(level='CRITICAL'):
+            self.assertEqual(list(self.journal.entries_in_period(
+                            "June 31, 2015", "Jul 3, 2015")), [])
+
+    def test_income_statement(self):
+        cofa = debk.ChartOfAccounts(D)
+        cofa.load_journal_entries(self.journal)
+        self.assertEqual(cofa.accounts['5300'].balance, 91260)
+        july = cofa.for_period(self.journal, "Jul 1, 2015",
+                                            "Jul 31, 2015")
+        self.assertEqual(july.accounts['5300'].balance, 30420)
+        statement = cofa.show_income_statement("Jul 1, 2015",
+                            "Jul 31, 2015", journal=self.journal)
+        self.assertIn("Jul 1, 2015 to Jul 31, 2015", statement)
+        self.assertIn("304.20", statement)
+        self.assertNotIn("912.60", statement)
+        cofa.journal = self.journal  # As set by setup_entity.
+        self.assertEqual(cofa.show_income_statement("Jul 1, 2015",
+                                                    "Jul 31, 2015"),
+                        statement)
+
+    def test_balance_as_of(self):
+        self.assertEqual(self.journal.balance_as_of('5300',
+                                        "May 31, 2015"), 0)
+        self.assertEqual(self.journal.balance_as_of('5300',
+                                        "Jul 3, 2015"), 30420)
+        self.assertEqual(self.journal.balance_as_of('1010',
+                                        "Jul 31, 2015"), 1000000 - 60840)
+        self.journal.load(Checkpoint.entries.replace('July 4', 'May 1'))
+        self.assertEqual(self.journal.balance_as_of('5300',
+                                        "Jul 3, 2015"), 60840)
+        cofa = debk.ChartOfAccounts(D)
+        cofa.load_journal_entries(self.journal)
+        cofa.journal = self.journal
+        self.assertEqual(cofa.sum_accounts(debk.config.EXPENSE_RANGE,
+                                as_of="Jul 3, 2015"), 60840)
+        self.assertEqual(cofa.sum_accounts(debk.config.EXPENSE_RANGE,
+                                as_of="Dec 31, 2015"),
+                        cofa.sum_accounts(debk.config.EXPENSE_RANGE))
+        self.assertEqual(cofa.sum_accounts('3000:3999',
+                                as_of="Jul 3, 2015"), 1500000)
+        with self.assertLogs(level='CRITICAL'):
+            self.assertEqual(self.journal.balance_as_of('1010',
+                                        "Jul 32, 2015"), 0)
+            self.assertEqual(cofa.sum_accounts('3000:3999',
+                                as_of="Jul 32, 2015"), 0)
+
+    def test_write_joined(self):
+        cofa = debk.ChartOfAccounts(D)
+        cofa.load_journal_entries(self.journal)
+        for pieces, joined in (
+                (self.journal.iter_show(), self.journal.show()),
+                (cofa.iter_show_accounts(), cofa.show_accounts()),
+                (cofa.iter_show_balance_sheet("Dec 31, 2015"),
+                    cofa.show_balance_sheet("Dec 31, 2015")),
+                ([], ''), (['a'], 'a')):
+            written = io.StringIO()
+            debk.write_joined(pieces, written)
+            with self.subTest(joined=joined[:40]):
+                self.assertEqual(written.getvalue(), joined)
+
+    def test_show_again(self):
+        cofa = debk.ChartOfAccounts(D)
+        entries = list(self.journal)
+        cofa.load_journal_entries(entries[:2])
+        shown = cofa.show_accounts()
+        cofa.verbosity = 1
+        self.assertNotEqual(cofa.show_accounts(), shown)
+        cofa.verbosity = D['verbosity']
+        self.assertEqual(cofa.show_accounts(), shown)
+        cofa.load_journal_entries(entries[2:])
+        self.assertNotEqual(cofa.show_accounts(), shown)
+        fresh = debk.ChartOfAccounts(D)
+        fresh.load_journal_entries(entries)
+        self.assertEqual(cofa.show_accounts(), fresh.show_accounts())
+
+    def test_kept_report(self):
+        cofa = debk.ChartOfAccounts(D)
+        cofa.load_journal_entries(self.journal)
+        shown = cofa.show_accounts()
+        self.assertEqual(cofa._last_report[2], shown)
+        self.assertEqual(list(cofa.iter_show_accounts()), [shown])
+        sheet = cofa.show_balance_sheet('2016-12-31')
+        self.assertEqual(cofa._last_report[2], sheet)
+        self.assertEqual(cofa.show_accounts(), shown)
+        cofa.accounts['5300'].post(debk.LineItem(7, 'D', cents=100))
+        self.assertNotEqual(cofa.show_accounts(), shown)
+
+    def test_range_sums(self):
+        cofa = debk.ChartOfAccounts(D)
+        self.assertEqual(cofa.codes_in_range(5000, 5999),
+                [code for code in cofa.ordered_codes
+                    if 5000 <= int(code) <= 5999])
+        entries = list(self.journal)
+        cofa.load_journal_entries(entries[:2])
+        self.assertEqual(cofa.get_net_income(), -30420)
+        self.assertEqual(cofa.get_net_income(), -30420)  # Cached.
+        cofa.load_journal_entries(entries[2:])
+        self.assertEqual(cofa.get_net_income(), -91260)
+        cofa.accounts['5300'].post(debk.LineItem(7, 'D', cents=100))
+        self.assertEqual(cofa.get_net_income(), -91360)
+
+    def tearDown(self):
+        shutil.rmtree('./tests/debk.d/testentity.d')
+
+class Columnar(unittest.TestCase):
+    """Test keeping postings in arrays (the 'columnar' default.)"""
+
+    def setUp(self):
+        if os.path.isdir('./tests/debk.d/testentity.d'):
+            shutil.rmtree('./tests/debk.d/testentity.d')
+        E.create_entity("testentity", D)
+        entries = debk.JournalEntry.load(Checkpoint.entries)
+        self.listed = debk.ChartOfAccounts(D)
+        self.listed.load_journal_entries(entries)
+        self.columnar = debk.ChartOfAccounts(dict(D, columnar=True))
+        self.columnar.load_journal_entries(entries)
+
+    def test_store(self):
+        line_items = self.columnar.accounts['1010'].line_items
+        self.assertIsInstance(line_items, debk.PostingColumns)
+        self.assertEqual(len(line_items),
+                len(self.listed.accounts['1010'].line_items))
+
+    def test_same_balances(self):
+        for code in self.listed.ordered_codes:
+            account = self.columnar.accounts[code]
+            posted = (account.balance, account.type_)
+            account.update_balance()
+            with self.subTest(code=code):
+                self.assertEqual(posted,
+                                (account.balance, account.type_))
+                self.assertEqual(posted,
+                            (self.listed.accounts[code].balance,
+                            self.listed.accounts[code].type_))
+
+    def test_same_display(self):
+        self.assertEqual(self.columnar.show_accounts(),
+                        self.listed.show_accounts())
+
+    def tearDown(self):
+        shutil.rmtree('./tests/debk.d/testentity.d')
+
 class Ledger(unittest.TestCase):
     """Test ChartOfAccounts and Account classes."""
     test_entity = "Manero"
@@ -519,12 +1073,12 @@ class Ledger(unittest.TestCase):
     def test_sum_accounts0(self):
         """This test will break if the account code schema changes."""
         testdata = [
-            (self.cofa.sum_accounts("1000:1999"), 22600.00), 
-            (self.cofa.sum_accounts("2000:2999"), 7000.00),  # 0
-            (self.cofa.sum_accounts("3000:3999"), 15000.00), # 
-            (self.cofa.sum_accounts("4000:4999"), 600.00),  
-            (self.cofa.sum_accounts("5000:5999"), 00.00),  #
-            (self.cofa.get_net_income(), 600.00),
+            (self.cofa.sum_accounts("1000:1999"), 2260000), 
+            (self.cofa.sum_accounts("2000:2999"), 700000),  # 0
+            (self.cofa.sum_accounts("3000:3999"), 1500000), # 
+            (self.cofa.sum_accounts("4000:4999"), 60000),  
+            (self.cofa.sum_accounts("5000:5999"), 0),  #
+            (self.cofa.get_net_income(), 60000),
                     ]
         for acnt_sum, amount in testdata:
             with self.subTest(acnt_sum=acnt_sum, amount=amount):
@@ -545,11 +1099,11 @@ class Ledger(unittest.TestCase):
     def test_sum_accounts1(self):
         self.assertEqual('{:.2f}'.format(
                             self.cofa.sum_accounts([1210, 1311])),
-                        '{:.2f}'.format(7000))
+                        '{:.2f}'.format(700000))
     def test_sum_accounts2(self):
         total = '{:.2f}'.format(
                 self.cofa.sum_accounts("2000:3999"))
-        self.assertEqual(total, '{:.2f}'.format(22000))
+        self.assertEqual(total, '{:.2f}'.format(2200000))
 
     def tearDown(self):
         if os.path.isdir(self.entity_dir):
@@ -66,48 +66,39 @@ class Account_signed_balance(unittest.TestCase):
                 hidden= 'F', place_holder= 'F')
         testdata = []
 
-        acnt1p = debk.Account(acnt_dict)
-        acnt1p.code = '1110'
+        acnt1p = debk.Account(dict(acnt_dict, code= '1110'))
         acnt1p.balance = 1.5; acnt1p.type_ = 'D'
         testdata.append((acnt1p.signed_balance, 1.5))
         acnt1n = debk.Account(acnt_dict)
         acnt1n.balance = -2.5; acnt1n.type_ = 'D'
         testdata.append((acnt1n.signed_balance, -2.5))
         
-        acnt2p = debk.Account(acnt_dict)
-        acnt2p.code = '2110'
+        acnt2p = debk.Account(dict(acnt_dict, code= '2110'))
         acnt2p.balance = 3.5; acnt2p.type_ = 'C'
         testdata.append((acnt2p.signed_balance, 3.5))
-        acnt2n = debk.Account(acnt_dict)
-        acnt2n.code = '2110'
+        acnt2n = debk.Account(dict(acnt_dict, code= '2110'))
         acnt2n.balance = -4.5; acnt2n.type_ = 'C'
         testdata.append((acnt2n.signed_balance, -4.5))
         
-        acnt3p = debk.Account(acnt_dict)
-        acnt3p.code = '3110'
+        acnt3p = debk.Account(dict(acnt_dict, code= '3110'))
         acnt3p.balance = 5.5; acnt3p.type_ = 'C'
         testdata.append((acnt3p.signed_balance, 5.5))
-        acnt3n = debk.Account(acnt_dict)
-        acnt3n.code = '3110'
+        acnt3n = debk.Account(dict(acnt_dict, code= '3110'))
         acnt3n.balance = -6.5; acnt3n.type_ = 'C'
 #       print(acnt3n.show_account())   # debugging print
         testdata.append((acnt3n.signed_balance, -6.5))
         
-        acnt4p = debk.Account(acnt_dict)
-        acnt4p.code = '4110'
+        acnt4p = debk.Account(dict(acnt_dict, code= '4110'))
         acnt4p.balance = 7.5; acnt4p.type_ = 'C'
         testdata.append((acnt4p.signed_balance, 7.5))
-        acnt4n = debk.Account(acnt_dict)
-        acnt4n.code = '4110'
+        acnt4n = debk.Account(dict(acnt_dict, code= '4110'))
         acnt4n.balance = -8.5; acnt4n.type_ = 'C'
         testdata.append((acnt4n.signed_balance, -8.5))
         
-        acnt5p = debk.Account(acnt_dict)
-        acnt5p.code = '5110'
+        acnt5p = debk.Account(dict(acnt_dict, code= '5110'))
         acnt5p.balance = 9.5; acnt5p.type_ = 'D'
         testdata.append((acnt5p.signed_balance, 9.5))
-        acnt5n = debk.Account(acnt_dict)
-        acnt5n.code = '5110'
+        acnt5n = debk.Account(dict(acnt_dict, code= '5110'))
         acnt5n.balance = -10.5; acnt5n.type_ = 'D'
         testdata.append((acnt5n.signed_balance, -10.5))
 